@@ -7,6 +7,7 @@ and PyInstaller compatibility for the ExplainShot application.
 
 import asyncio
 import logging
+import multiprocessing
 import signal
 import sys
 from pathlib import Path
@@ -566,4 +567,6 @@ def run_app():
 
 
 if __name__ == "__main__":
+    # Lets frozen builds start the gallery's thumbnail worker processes
+    multiprocessing.freeze_support()
     sys.exit(run_app())
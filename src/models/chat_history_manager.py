@@ -6,6 +6,7 @@ screenshot hash, replacing database storage with filesystem operations.
 """
 
 import asyncio
+import concurrent.futures
 import hashlib
 import json
 import logging
@@ -153,16 +154,23 @@ class ChatHistoryManager:
     and proper error handling for concurrent access.
     """
 
-    def __init__(self, chat_history_directory: str, logger=None):
+    def __init__(
+        self,
+        chat_history_directory: str,
+        logger=None,
+        executor: Optional[concurrent.futures.Executor] = None
+    ):
         """
         Initialize the chat history manager.
 
         Args:
             chat_history_directory: Base directory for chat storage
             logger: Optional logger instance
+            executor: Optional executor for file I/O (the loop's default executor if None)
         """
         self.chat_directory = Path(chat_history_directory)
         self.logger = logger or logging.getLogger(__name__)
+        self._executor = executor
         self._lock = asyncio.Lock()
         self._initialized = False
 
@@ -201,14 +209,12 @@ class ChatHistoryManager:
         try:
             conversation_dir = self._get_conversation_directory(screenshot_hash)
 
-            if not conversation_dir.exists():
-                return []
+            loop = asyncio.get_event_loop()
+            message_files = await loop.run_in_executor(
+                self._executor, self._list_message_files, conversation_dir
+            )
 
             messages = []
-            message_files = list(conversation_dir.glob("message_*.json"))
-
-            # Sort by message number extracted from filename
-            message_files.sort(key=lambda f: int(f.stem.split('_')[1]))
 
             for message_file in message_files:
                 try:
@@ -227,6 +233,34 @@ class ChatHistoryManager:
             self.logger.error(f"Failed to load conversation {screenshot_hash}: {e}")
             return []
 
+    async def get_next_message_id(self, screenshot_hash: str) -> int:
+        """
+        Get the ID for the next message in a conversation.
+
+        Only message filenames are listed; no message files are read or parsed.
+
+        Args:
+            screenshot_hash: SHA-256 hash of screenshot file
+
+        Returns:
+            One more than the highest stored message ID (1 for a new conversation)
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        try:
+            conversation_dir = self._get_conversation_directory(screenshot_hash)
+
+            loop = asyncio.get_event_loop()
+            message_files = await loop.run_in_executor(
+                self._executor, self._list_message_files, conversation_dir
+            )
+            return self._message_id(message_files[-1]) + 1 if message_files else 1
+
+        except Exception as e:
+            self.logger.error(f"Failed to get next message ID for {screenshot_hash}: {e}")
+            raise ChatHistoryError(f"Failed to get next message ID: {e}") from e
+
     async def save_message(
         self,
         screenshot_hash: str,
@@ -244,6 +278,28 @@ class ChatHistoryManager:
         Returns:
             True if saved successfully
         """
+        return await self.save_messages(screenshot_hash, [message], screenshot_metadata)
+
+    async def save_messages(
+        self,
+        screenshot_hash: str,
+        messages: List[ChatMessage],
+        screenshot_metadata: Optional['ScreenshotMetadata'] = None
+    ) -> bool:
+        """
+        Save several messages to the conversation, updating its metadata once.
+
+        Args:
+            screenshot_hash: SHA-256 hash of screenshot file
+            messages: ChatMessages to save, in order
+            screenshot_metadata: Optional screenshot metadata for conversation
+
+        Returns:
+            True if saved successfully
+        """
+        if not messages:
+            return True
+
         if not self._initialized:
             await self.initialize()
 
@@ -252,21 +308,23 @@ class ChatHistoryManager:
                 conversation_dir = self._get_conversation_directory(screenshot_hash)
                 conversation_dir.mkdir(parents=True, exist_ok=True)
 
-                # Generate filename with zero-padded message ID
-                filename = f"message_{message.message_id:04d}.json"
-                message_file = conversation_dir / filename
+                for message in messages:
+                    # Generate filename with zero-padded message ID
+                    filename = f"message_{message.message_id:04d}.json"
+                    message_file = conversation_dir / filename
 
-                # Save message atomically
-                await self._write_json_file(message_file, message.to_dict())
+                    # Save message atomically
+                    await self._write_json_file(message_file, message.to_dict())
 
                 # Update conversation metadata
                 await self._update_conversation_metadata(
                     screenshot_hash,
-                    message,
+                    messages,
                     screenshot_metadata
                 )
 
-                self.logger.debug(f"Saved message {message.message_id} to conversation {screenshot_hash}")
+                message_ids = ", ".join(str(message.message_id) for message in messages)
+                self.logger.debug(f"Saved message(s) {message_ids} to conversation {screenshot_hash}")
                 return True
 
             except Exception as e:
@@ -462,12 +520,24 @@ class ChatHistoryManager:
         except Exception as e:
             raise ChatHistoryError(f"Directory not writable: {e}") from e
 
+    @staticmethod
+    def _message_id(message_file: Path) -> int:
+        """Extract the message number from a message_NNNN.json filename."""
+        return int(message_file.stem.split('_')[1])
+
+    @classmethod
+    def _list_message_files(cls, conversation_dir: Path) -> List[Path]:
+        """List a conversation's message files ordered by message number (blocking)."""
+        if not conversation_dir.exists():
+            return []
+        return sorted(conversation_dir.glob("message_*.json"), key=cls._message_id)
+
     async def _read_json_file(self, file_path: Path) -> Dict[str, Any]:
         """Read JSON file asynchronously."""
         try:
             loop = asyncio.get_event_loop()
             content = await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: file_path.read_text(encoding='utf-8')
             )
             return json.loads(content)
@@ -485,12 +555,12 @@ class ChatHistoryManager:
             json_content = json.dumps(data, indent=2, ensure_ascii=False)
 
             await loop.run_in_executor(
-                None,
+                self._executor,
                 lambda: temp_path.write_text(json_content, encoding='utf-8')
             )
 
             # Atomic rename (replace handles existing files on Windows)
-            await loop.run_in_executor(None, lambda: temp_path.replace(file_path))
+            await loop.run_in_executor(self._executor, lambda: temp_path.replace(file_path))
 
         except Exception as e:
             # Clean up temp file if it exists
@@ -505,26 +575,28 @@ class ChatHistoryManager:
     async def _update_conversation_metadata(
         self,
         screenshot_hash: str,
-        message: ChatMessage,
+        messages: List[ChatMessage],
         screenshot_metadata: Optional['ScreenshotMetadata'] = None
     ) -> None:
-        """Update conversation metadata file."""
+        """Update conversation metadata file for newly saved messages."""
         try:
             conversation_dir = self._get_conversation_directory(screenshot_hash)
             metadata_file = conversation_dir / "metadata.json"
 
+            new_tokens = sum(sum(message.tokens.values()) for message in messages if message.tokens)
+            assistant_models = [message.model for message in messages if message.role == "assistant"]
+
             # Load existing metadata or create new
             if metadata_file.exists():
                 existing_data = await self._read_json_file(metadata_file)
                 metadata = ConversationMetadata.from_dict(existing_data)
                 metadata.updated_at = datetime.now()
-                metadata.message_count += 1
+                metadata.message_count += len(messages)
 
-                # Update model and token info if it's an assistant message
-                if message.role == "assistant":
-                    metadata.model_used = message.model
-                    if message.tokens:
-                        metadata.total_tokens += sum(message.tokens.values())
+                # Update model and token info from assistant messages
+                if assistant_models:
+                    metadata.model_used = assistant_models[-1]
+                metadata.total_tokens += new_tokens
             else:
                 # Create new metadata
                 metadata = ConversationMetadata(
@@ -533,9 +605,9 @@ class ChatHistoryManager:
                     screenshot_path=screenshot_metadata.full_path if screenshot_metadata else "",
                     created_at=datetime.now(),
                     updated_at=datetime.now(),
-                    message_count=1,
-                    model_used=message.model if message.role == "assistant" else "unknown",
-                    total_tokens=sum(message.tokens.values()) if message.tokens else 0
+                    message_count=len(messages),
+                    model_used=assistant_models[-1] if assistant_models else "unknown",
+                    total_tokens=new_tokens
                 )
 
             # Save updated metadata
@@ -597,9 +597,7 @@ class OllamaClient:
             if not self.chat_history_manager:
                 return
 
-            # Load existing conversation to get next message ID
-            existing_messages = await self.chat_history_manager.load_conversation(screenshot_hash)
-            next_id = len(existing_messages) + 1
+            next_id = await self.chat_history_manager.get_next_message_id(screenshot_hash)
 
             # Note: User message should already be saved by GalleryWindow
             # Only save the assistant response here
@@ -13,7 +13,7 @@ import tempfile
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, TYPE_CHECKING, Any
+from typing import Optional, List, Dict, TYPE_CHECKING, Any
 
 try:
     from PIL import Image, ImageGrab
@@ -71,6 +71,9 @@ class ScreenshotManager:
         self._capture_count = 0
         self._last_cleanup = datetime.now()
 
+        # Metadata from the last directory scan and later captures, keyed by hash
+        self._metadata_index: Dict[str, ScreenshotMetadata] = {}
+
         # Performance tracking
         self._capture_times = []
         self._save_times = []
@@ -179,6 +182,7 @@ class ScreenshotManager:
             )
 
             # Note: No database registration in v3 - files are discovered via filesystem scan
+            self._index_metadata(metadata)
 
             # Update statistics
             self._capture_count += 1
@@ -317,6 +321,7 @@ class ScreenshotManager:
             await self._setup_directory()
 
             if old_directory != self._current_directory:
+                self._metadata_index.clear()
                 await self.event_bus.emit("screenshot.directory_changed", {
                     "old_path": old_directory,
                     "new_path": self._current_directory
@@ -501,6 +506,11 @@ class ScreenshotManager:
             # Sort by timestamp (newest first)
             screenshots.sort(key=lambda x: x.timestamp, reverse=True)
 
+            # Rebuild the lookup index so files removed since the last scan drop out
+            self._metadata_index = {}
+            for metadata in screenshots:
+                self._index_metadata(metadata)
+
             self.logger.debug(f"Discovered {len(screenshots)} screenshots in directory")
 
             # Emit discovery event
@@ -516,6 +526,23 @@ class ScreenshotManager:
             self.logger.error(f"Failed to scan screenshot directory: {e}")
             return []
 
+    def get_by_hash(self, screenshot_hash: str) -> Optional[ScreenshotMetadata]:
+        """
+        Look up screenshot metadata from the last directory scan.
+
+        Args:
+            screenshot_hash: Screenshot hash (the same value as its unique_id)
+
+        Returns:
+            ScreenshotMetadata object or None if not seen by a scan yet
+        """
+        return self._metadata_index.get(screenshot_hash)
+
+    def _index_metadata(self, metadata: ScreenshotMetadata) -> None:
+        """Add metadata to the lookup index under its hash (unique_id is the same value)."""
+        if metadata.hash:
+            self._metadata_index[metadata.hash] = metadata
+
     async def _derive_metadata_from_file(self, file_path: Path) -> Optional[ScreenshotMetadata]:
         """
         Derive screenshot metadata from file properties.
@@ -5,13 +5,19 @@ Provides functionality to load CSS stylesheets for different components and them
 """
 
 import logging
+import re
 import sys
 from pathlib import Path
-from typing import Optional, List, Union
-from PyQt6.QtCore import QFile
+from typing import Dict, List, Optional, Tuple, Union
+from PyQt6.QtCore import QFile, Qt
+from PyQt6.QtWidgets import QLabel, QPushButton
 
 logger = logging.getLogger(__name__)
 
+# Item states, each backed by a "<element>-<state>.css" file ('normal' uses "<element>.css")
+SCREENSHOT_ITEM_STATES = ['normal', 'hover', 'selected', 'selected-hover']
+PRESET_ITEM_STATES = ['normal', 'hover']
+
 
 def _get_resource_path(relative_path: str) -> str:
     """
@@ -36,10 +42,17 @@ def _get_resource_path(relative_path: str) -> str:
     return str(base_path)
 
 
+# Stylesheets read so far, keyed by (component, theme, element); failed reads are not cached
+_stylesheet_cache: Dict[Tuple[str, str, str], str] = {}
+
+
 def load_stylesheet(component: str, theme: str, element: str) -> Optional[str]:
     """
     Load a CSS stylesheet for a given component, theme, and element.
 
+    Stylesheets are bundled resources, so each file is read once per process;
+    a file that could not be read is retried on the next call.
+
     Args:
         component: The component name (e.g., "overlay", "gallery")
         theme: The theme name (e.g., "dark", "light")
@@ -48,6 +61,17 @@ def load_stylesheet(component: str, theme: str, element: str) -> Optional[str]:
     Returns:
         The CSS content as a string, or None if loading failed
     """
+    key = (component, theme, element)
+    content = _stylesheet_cache.get(key)
+    if content is None:
+        content = _read_stylesheet(component, theme, element)
+        if content is not None:
+            _stylesheet_cache[key] = content
+    return content
+
+
+def _read_stylesheet(component: str, theme: str, element: str) -> Optional[str]:
+    """Read a stylesheet file from the bundled resources, or return None if it cannot be read."""
     relative_css_path = f"resources/{component}/styles/{theme}/{element}.css"
     css_file_path = _get_resource_path(relative_css_path)
 
@@ -96,6 +120,40 @@ def load_stylesheets(component: str, theme: str, elements: List[str]) -> Optiona
         return None
 
 
+def qualify_css_for_state(css_content: str, root_selector: str, state: str) -> str:
+    """
+    Scope every rule of a stylesheet to a root widget carrying a dynamic "state" property.
+
+    Rules for the root itself become root[state="..."]; all other rules are nested
+    under it, so several state stylesheets can live in one sheet side by side.
+
+    Args:
+        css_content: The CSS content to scope
+        root_selector: Selector of the root widget (e.g., "#ScreenshotItem")
+        state: Value of the root's "state" property the rules should apply to
+
+    Returns:
+        The scoped CSS content
+    """
+    qualified_root = f'{root_selector}[state="{state}"]'
+    # The root selector only matches whole names, so "#ScreenshotItemHeader" is not the root
+    root_pattern = re.compile(re.escape(root_selector) + r'(?![\w-])')
+    css_content = re.sub(r'/\*.*?\*/', '', css_content, flags=re.DOTALL)
+
+    rules = []
+    for selectors, body in re.findall(r'([^{}]+)\{([^{}]*)\}', css_content):
+        scoped = []
+        for selector in selectors.split(','):
+            selector = selector.strip()
+            if root_pattern.match(selector):
+                scoped.append(qualified_root + selector[len(root_selector):])
+            else:
+                scoped.append(f"{qualified_root} {selector}")
+        rules.append(f"{', '.join(scoped)} {{{body}}}")
+
+    return "\n".join(rules)
+
+
 def get_dynamic_css(css_class: str, styles: dict) -> str:
     """
     Generate dynamic CSS from a dictionary of styles.
@@ -173,12 +231,20 @@ class DynamicStyleManager:
         self.theme = theme
         self._base_css = None
         self._state_css_cache = {}
+        self._item_css_cache = {}  # Combined per-state item stylesheets, see get_item_states_css()
 
     def load_base_styles(self) -> str:
         """Load and cache base styles for the component."""
         if self._base_css is None:
             elements = ["base", "screenshot-items", "preset-items", "chat-widget"]
-            self._base_css = load_stylesheets(self.component, self.theme, elements)
+            base_css = load_stylesheets(self.component, self.theme, elements)
+            if base_css:
+                # Item states are selected by a property, so their rules live in the one top-level sheet
+                self._base_css = combine_css(
+                    base_css,
+                    self.get_item_states_css('screenshot-items', '#ScreenshotItem', SCREENSHOT_ITEM_STATES),
+                    self.get_item_states_css('preset-items', '#PresetItem', PRESET_ITEM_STATES)
+                )
         return self._base_css or ""
 
     def get_state_css(self, state: str) -> str:
@@ -217,6 +283,55 @@ class DynamicStyleManager:
         widget.setStyleSheet(combined_css)
         refresh_widget_style(widget)
 
+    def get_item_states_css(self, element: str, root_selector: str, states: List[str]) -> str:
+        """
+        Get one stylesheet holding every state of an item, selected by its "state" property.
+
+        Args:
+            element: Base element name of the item styles (e.g., 'screenshot-items')
+            root_selector: Selector of the item widget (e.g., '#ScreenshotItem')
+            states: States to include; 'normal' maps to the base element file
+
+        Returns:
+            Combined CSS content for all states
+        """
+        if element not in self._item_css_cache:
+            self._item_css_cache[element] = combine_css(*(
+                qualify_css_for_state(
+                    self.get_state_css(element if state == 'normal' else f'{element}-{state}'),
+                    root_selector, state
+                )
+                for state in states
+            ))
+        return self._item_css_cache[element]
+
+    def apply_item_state(self, widget, state: str) -> None:
+        """
+        Switch an item widget to a state by updating its "state" property.
+
+        The rules for every state are part of the base stylesheet set on the window
+        (see load_base_styles()), so items never get a stylesheet of their own.
+
+        Args:
+            widget: The item widget
+            state: The state to apply
+        """
+        if widget.property("state") == state:
+            return
+        widget.setProperty("state", state)
+
+        # Not polished yet: the new property is picked up when the widget is first shown
+        if not widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            return
+
+        # Property selectors are only re-evaluated when a widget is re-polished. Besides the item,
+        # the state rules only style its labels and buttons, so layout containers are left alone
+        style = widget.style()
+        if style:
+            for target in (widget, *widget.findChildren((QLabel, QPushButton))):
+                style.unpolish(target)
+                style.polish(target)
+
     def apply_screenshot_item_state(self, widget, state: str) -> None:
         """
         Apply a specific state CSS to a screenshot item widget.
@@ -225,14 +340,7 @@ class DynamicStyleManager:
             widget: The screenshot item widget
             state: The state to apply ('normal', 'hover', 'selected', 'selected-hover')
         """
-        if state == 'normal':
-            css_content = self.get_state_css('screenshot-items')
-        else:
-            css_content = self.get_state_css(f'screenshot-items-{state}')
-
-        if css_content:
-            widget.setStyleSheet(css_content)
-            refresh_widget_style(widget)
+        self.apply_item_state(widget, state)
 
     def apply_preset_item_state(self, widget, state: str) -> None:
         """
@@ -242,14 +350,7 @@ class DynamicStyleManager:
             widget: The preset item widget
             state: The state to apply ('normal', 'hover')
         """
-        if state == 'normal':
-            css_content = self.get_state_css('preset-items')
-        else:
-            css_content = self.get_state_css(f'preset-items-{state}')
-
-        if css_content:
-            widget.setStyleSheet(css_content)
-            refresh_widget_style(widget)
+        self.apply_item_state(widget, state)
 
     def refresh_theme(self, new_theme: str) -> None:
         """
@@ -262,6 +363,7 @@ class DynamicStyleManager:
             self.theme = new_theme
             self._base_css = None
             self._state_css_cache.clear()
+            self._item_css_cache.clear()
 
 
 class ScreenshotItemStyleManager:
@@ -6,10 +6,10 @@ Exports all gallery component classes for easy importing.
 
 from .custom_title_bar import CustomTitleBar
 from .chat_interface import ChatInterface, ChatWidget
-from .screenshots_gallery import ScreenshotGallery, ScreenshotItem, ThumbnailLoader
+from .screenshots_gallery import ScreenshotGallery, ScreenshotItem, ThumbnailLoader, shutdown_thumbnail_pool
 from .presets_panel import PresetsPanel, PresetItem
 from .gallery_widgets import (
-    PresetData, ChatMessage, GalleryState, GalleryEventTypes,
+    PresetData, ChatMessage, GalleryState, GalleryEventTypes, TTLCache,
     THUMBNAIL_SIZE, THUMBNAIL_DISPLAY_SIZE, PRESET_ITEM_HEIGHT,
     GRID_COLS_PER_ROW, MAX_FILENAME_LENGTH, MAX_PROMPT_PREVIEW_LENGTH,
     MAX_INDICATOR_LENGTH
@@ -27,6 +27,7 @@ __all__ = [
     'ScreenshotGallery',
     'ScreenshotItem',
     'ThumbnailLoader',
+    'shutdown_thumbnail_pool',
 
     # Presets panel
     'PresetsPanel',
@@ -37,6 +38,7 @@ __all__ = [
     'ChatMessage',
     'GalleryState',
     'GalleryEventTypes',
+    'TTLCache',
 
     # Constants
     'THUMBNAIL_SIZE',
@@ -6,11 +6,12 @@ Implements the AI chat interface for the gallery's middle column.
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
 import markdown2
 
 from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextBrowser,
     QLineEdit, QPushButton, QLabel
@@ -22,6 +23,18 @@ from .gallery_widgets import ChatMessage
 
 logger = logging.getLogger(__name__)
 
+_MARKDOWN_EXTRAS = ["fenced-code-blocks", "tables", "break-on-newline"]
+_chat_css = None  # Contents of chat.css, read on first use
+
+
+def _chat_stylesheet() -> str:
+    """Return the chat stylesheet, loading chat.css once per process."""
+    global _chat_css
+    if _chat_css is None:
+        # Fallback to empty CSS
+        _chat_css = load_stylesheet("gallery", "dark", "chat") or ""
+    return _chat_css
+
 
 class ChatWidget(QWidget):
     """Chat interface widget for AI interactions."""
@@ -31,6 +44,8 @@ class ChatWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.chat_messages: List[ChatMessage] = []
+        self._message_html: List[str] = []  # Rendered HTML for each entry in chat_messages
+        self._stream_start: Optional[int] = None  # Document position where streamed text begins
 
         self.setObjectName("ChatWidget")
         self._setup_ui()
@@ -45,6 +60,8 @@ class ChatWidget(QWidget):
         # Chat history
         self.chat_history = QTextBrowser()
         self.chat_history.setMinimumHeight(400)
+        # Applied to all HTML inserted later, so message fragments don't need to embed it
+        self.chat_history.document().setDefaultStyleSheet(_chat_stylesheet())
         layout.addWidget(self.chat_history)
 
         # Input area
@@ -83,8 +100,8 @@ class ChatWidget(QWidget):
             content=content,
             timestamp=datetime.now()
         )
-        self.chat_messages.append(message)
-        self._update_chat_display()
+        self._append(message)
+        self._insert_html(self._message_html[-1])
 
     def add_ai_message(self, content: str):
         """Add an AI response to the chat."""
@@ -93,8 +110,8 @@ class ChatWidget(QWidget):
             content=content,
             timestamp=datetime.now()
         )
-        self.chat_messages.append(message)
-        self._update_chat_display()
+        self._append(message)
+        self._insert_html(self._message_html[-1])
 
     def add_system_message(self, content: str):
         """Add a system message to the chat."""
@@ -103,8 +120,42 @@ class ChatWidget(QWidget):
             content=content,
             timestamp=datetime.now()
         )
+        self._append(message)
+        self._insert_html(self._message_html[-1])
+
+    def add_messages(self, messages: Iterable[Tuple[str, str]]):
+        """Add several (sender, content) messages and render the chat once."""
+        timestamp = datetime.now()
+        first = len(self._message_html)
+        for sender, content in messages:
+            self._append(ChatMessage(sender=sender, content=content, timestamp=timestamp))
+        if len(self._message_html) > first:
+            self._insert_html("".join(self._message_html[first:]))
+
+    def _append(self, message: ChatMessage):
+        """Store a message along with its rendered HTML, so redraws never re-render it."""
         self.chat_messages.append(message)
-        self._update_chat_display()
+        self._message_html.append(self._render_message(message))
+
+    def append_streaming_text(self, text: str):
+        """Append streamed response text as plain text below the last message."""
+        cursor = self.chat_history.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if self._stream_start is None:
+            self._stream_start = cursor.position()
+            cursor.insertBlock()
+        cursor.insertText(text)
+        self._scroll_to_bottom()
+
+    def discard_streaming_text(self):
+        """Remove any streamed text appended since the last message."""
+        if self._stream_start is None:
+            return
+        cursor = self.chat_history.textCursor()
+        cursor.setPosition(self._stream_start)
+        cursor.movePosition(QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        self._stream_start = None
 
     def set_prompt_text(self, prompt: str):
         """Set text in the input field."""
@@ -114,6 +165,8 @@ class ChatWidget(QWidget):
     def clear_chat(self):
         """Clear chat history."""
         self.chat_messages.clear()
+        self._message_html.clear()
+        self._stream_start = None
         self._update_chat_display()
 
     def set_status(self, status: str):
@@ -121,40 +174,42 @@ class ChatWidget(QWidget):
         self.status_label.setText(status)
 
     def _update_chat_display(self):
-        """Update the chat history display."""
+        """Rebuild the whole chat history display."""
         html_content = self._generate_chat_html()
         self.chat_history.setHtml(html_content)
-
-        # Scroll to bottom
+        self._scroll_to_bottom()
+
+    def _insert_html(self, html_content: str):
+        """Append rendered messages at the end of the chat without re-laying out earlier ones."""
+        # Rendered messages replace the streamed preview, which always stays last
+        self.discard_streaming_text()
+        cursor = self.chat_history.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertHtml(html_content)
+        self._scroll_to_bottom()
+
+    def _scroll_to_bottom(self):
+        """Scroll the chat history to the latest message."""
         scrollbar = self.chat_history.verticalScrollBar()
         if scrollbar:
             scrollbar.setValue(scrollbar.maximum())
 
     def _generate_chat_html(self) -> str:
         """Generate HTML for chat messages."""
-        # Load CSS from file
-        css_content = load_stylesheet("gallery", "dark", "chat")
-        if css_content is None:
-            css_content = ""  # Fallback to empty CSS
-
-        html = f"""
-        <style>
-            {css_content}
-        </style>
-        <body>
-        """
-
-        for message in self.chat_messages:
-            timestamp_str = message.timestamp.strftime("%H:%M:%S")
-            sender_class = f"message-{message.sender}"
-
-            # Convert markdown to HTML for AI and user messages
-            if message.sender in ["ai", "user"]:
-                content_html = markdown2.markdown(message.content, extras=["fenced-code-blocks", "tables", "break-on-newline"])
-            else:
-                content_html = self._escape_html(message.content)
-
-            html += f"""
+        return "".join(["<body>", *self._message_html, "</body>"])
+
+    def _render_message(self, message: ChatMessage) -> str:
+        """Render a single chat message to HTML."""
+        timestamp_str = message.timestamp.strftime("%H:%M:%S")
+        sender_class = f"message-{message.sender}"
+
+        # Convert markdown to HTML for AI and user messages
+        if message.sender in ["ai", "user"]:
+            content_html = markdown2.markdown(message.content, extras=_MARKDOWN_EXTRAS)
+        else:
+            content_html = self._escape_html(message.content)
+
+        return f"""
             <div class="message-delimiter"></div>
             <div class="message {sender_class}">
                 <div class="message-header">
@@ -165,9 +220,6 @@ class ChatWidget(QWidget):
             </div>
             """
 
-        html += "</body>"
-        return html
-
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters."""
         return (text.replace('&', '&amp;')
@@ -200,7 +252,7 @@ class ChatInterface(QWidget):
 
         # Chat widget
         self.chat_widget = ChatWidget()
-        self.chat_widget.message_sent.connect(self.message_sent.emit)
+        self.chat_widget.message_sent.connect(self.message_sent)  # Forwarded by Qt, no Python slot
         layout.addWidget(self.chat_widget)
 
     def add_user_message(self, content: str):
@@ -215,6 +267,18 @@ class ChatInterface(QWidget):
         """Add a system message to the chat."""
         self.chat_widget.add_system_message(content)
 
+    def add_messages(self, messages: Iterable[Tuple[str, str]]):
+        """Add several (sender, content) messages in a single render pass."""
+        self.chat_widget.add_messages(messages)
+
+    def append_streaming_text(self, text: str):
+        """Append streamed response text below the last message."""
+        self.chat_widget.append_streaming_text(text)
+
+    def discard_streaming_text(self):
+        """Remove the streamed response text shown so far."""
+        self.chat_widget.discard_streaming_text()
+
     def set_prompt_text(self, prompt: str):
         """Set text in the input field."""
         self.chat_widget.set_prompt_text(prompt)
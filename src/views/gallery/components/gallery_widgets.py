@@ -4,14 +4,16 @@ Shared Gallery Widget Components
 Data structures and utilities shared across gallery modules.
 """
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PresetData:
-    """Represents a prompt preset for gallery display."""
+    """Represents a prompt preset for gallery display (immutable, so cached instances can be shared)."""
     id: str  # File-based ID instead of database integer
     name: str
     prompt: str
@@ -20,7 +22,7 @@ class PresetData:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """Represents a chat message in the gallery."""
     sender: str  # 'user', 'ai', 'system'
@@ -29,7 +31,7 @@ class ChatMessage:
     message_type: str = "text"  # 'text', 'image', 'error'
 
 
-@dataclass
+@dataclass(slots=True)
 class GalleryState:
     """Tracks the current state of the gallery."""
     selected_screenshot_id: Optional[str] = None  # Now uses hash-based string ID
@@ -43,6 +45,74 @@ class GalleryState:
             self.chat_messages = []
 
 
+class TTLCache:
+    """
+    Bounded mapping whose entries expire a fixed time after being stored.
+
+    Entries are kept in insertion order, so the oldest entry is evicted first
+    when the cache is full and expired entries are always at the front.
+    Expiry uses the monotonic clock and is checked lazily on access.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._data.pop(key, None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __getitem__(self, key: Any) -> Any:
+        expires_at, value = self._data[key]
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self) -> int:
+        self.expire()
+        return len(self._data)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the value for key if present and not expired, else default."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, values: Dict[Any, Any]) -> None:
+        """Store several entries at once."""
+        for key, value in values.items():
+            self[key] = value
+
+    def expire(self) -> None:
+        """Drop all expired entries."""
+        now = time.monotonic()
+        while self._data:
+            expires_at, _ = next(iter(self._data.values()))
+            if expires_at > now:
+                break
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        # Swap in a fresh mapping rather than emptying the old one in place
+        self._data = OrderedDict()
+
+
 class GalleryEventTypes:
     """Event constants for gallery modules."""
 
@@ -66,8 +136,12 @@ class GalleryEventTypes:
 # Gallery configuration constants
 THUMBNAIL_SIZE = (120, 120)
 THUMBNAIL_DISPLAY_SIZE = (118, 118)
+THUMBNAIL_DISK_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Least recently used thumbnails are deleted beyond this
+THUMBNAIL_DISK_CACHE_TRIM_INTERVAL = 50  # Disk cache writes between size checks
 PRESET_ITEM_HEIGHT = 80
 GRID_COLS_PER_ROW = 2
+INITIAL_SCREENSHOT_ITEMS = 24  # Screenshot items built when the gallery opens
+SCREENSHOT_ITEMS_BATCH = 12  # Screenshot items built each time the view nears the end
 MAX_FILENAME_LENGTH = 20
 MAX_PROMPT_PREVIEW_LENGTH = 80
 MAX_INDICATOR_LENGTH = 36
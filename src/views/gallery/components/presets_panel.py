@@ -176,31 +176,36 @@ class PresetsPanel(QWidget):
                 key=lambda item: (item[1].is_builtin, item[0])  # False (user) before True (builtin), then by ID
             )
 
-            for preset_id, preset in sorted_presets:
-                if len(self.preset_items) >= limit:
-                    break
-
-                preset_data = PresetData(
-                    id=preset_id,
-                    name=preset.name,
-                    prompt=preset.prompt,
-                    description=preset.description,
-                    usage_count=preset.usage_count,
-                    created_at=preset.created_at
-                )
-
-                item = PresetItem(preset_data)
-                item.run_clicked.connect(lambda pid: self.preset_run_clicked.emit(pid))
-                item.paste_clicked.connect(lambda pid: self.preset_paste_clicked.emit(pid))
-
-                if self._preset_item_style_manager:
-                    item.set_style_manager(self._preset_item_style_manager)
-
-                self.presets_layout.insertWidget(
-                    self.presets_layout.count() - 1,
-                    item
-                )
-                self.preset_items[preset_id] = item
+            # Fill the column with the trailing stretch taken out and repaint once at the end
+            self.presets_container.setUpdatesEnabled(False)
+            self.presets_layout.takeAt(self.presets_layout.count() - 1)
+
+            try:
+                for preset_id, preset in sorted_presets:
+                    if len(self.preset_items) >= limit:
+                        break
+
+                    preset_data = PresetData(
+                        id=preset_id,
+                        name=preset.name,
+                        prompt=preset.prompt,
+                        description=preset.description,
+                        usage_count=preset.usage_count,
+                        created_at=preset.created_at
+                    )
+
+                    item = PresetItem(preset_data)
+                    item.run_clicked.connect(lambda pid: self.preset_run_clicked.emit(pid))
+                    item.paste_clicked.connect(lambda pid: self.preset_paste_clicked.emit(pid))
+
+                    if self._preset_item_style_manager:
+                        item.set_style_manager(self._preset_item_style_manager)
+
+                    self.presets_layout.addWidget(item)
+                    self.preset_items[preset_id] = item
+            finally:
+                self.presets_layout.addStretch()
+                self.presets_container.setUpdatesEnabled(True)
 
             logger.debug(f"Loaded {len(self.preset_items)} presets from preset manager")
 
@@ -5,21 +5,26 @@ Manages screenshot display, thumbnail loading, and selection in the gallery's le
 """
 
 import asyncio
+import hashlib
 import logging
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, TYPE_CHECKING
+from pathlib import Path
+from typing import Iterable, Optional, Dict, Tuple, TYPE_CHECKING
 
 from PyQt6.QtCore import (
-    Qt, QObject, pyqtSignal, QSize, QBuffer
+    Qt, QObject, pyqtSignal, QSize
 )
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QLabel, QGridLayout
 )
 from PyQt6.QtGui import (
-    QPixmap, QFont, QColor, QPainter
+    QImage, QPixmap, QPixmapCache, QFont, QColor, QPainter
 )
 
+from src import get_app_data_dir
 from src.utils.style_loader import ScreenshotItemStyleManager
 
 try:
@@ -29,44 +34,245 @@ except ImportError:
     Image = None
     PIL_AVAILABLE = False
 
+try:
+    import pyspng  # Optional: libspng decodes PNGs noticeably faster than PIL's decoder
+    PYSPNG_AVAILABLE = True
+except ImportError:
+    pyspng = None
+    PYSPNG_AVAILABLE = False
+
 if TYPE_CHECKING:
     from src.models.screenshot_manager import ScreenshotManager
 
 from .gallery_widgets import (
-    THUMBNAIL_SIZE, THUMBNAIL_DISPLAY_SIZE,
-    GRID_COLS_PER_ROW, MAX_FILENAME_LENGTH
+    THUMBNAIL_DISPLAY_SIZE,
+    GRID_COLS_PER_ROW, MAX_FILENAME_LENGTH,
+    INITIAL_SCREENSHOT_ITEMS, SCREENSHOT_ITEMS_BATCH,
+    THUMBNAIL_DISK_CACHE_MAX_BYTES, THUMBNAIL_DISK_CACHE_TRIM_INTERVAL
 )
 
 logger = logging.getLogger(__name__)
 
+# QPixmapCache budget Qt keeps for its own pixmaps (its default limit); thumbnails are added on top
+_QT_PIXMAP_CACHE_KB = 10240
+_THUMBNAIL_PIXMAP_KB = THUMBNAIL_DISPLAY_SIZE[0] * THUMBNAIL_DISPLAY_SIZE[1] * 4 // 1024
+
+# Thumbnails are decoded and resized in worker processes so several run truly in parallel
+THUMBNAIL_WORKERS = min(2, os.cpu_count() or 1)
+_thumbnail_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_thumbnail_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by all thumbnail loaders, starting it on first use."""
+    global _thumbnail_pool
+    if _thumbnail_pool is None:
+        # Spawn rather than fork: forking the running Qt/asyncio process copies locks held by its
+        # other threads into the workers (main.py calls freeze_support() for frozen builds)
+        _thumbnail_pool = ProcessPoolExecutor(
+            max_workers=THUMBNAIL_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _thumbnail_pool
+
+
+def shutdown_thumbnail_pool() -> None:
+    """Stop the thumbnail worker processes, dropping renders that have not started yet."""
+    global _thumbnail_pool
+    if _thumbnail_pool is not None:
+        _thumbnail_pool.shutdown(wait=False, cancel_futures=True)
+        _thumbnail_pool = None
+
+
+def _open_thumbnail_source(file_path: str):
+    """Open a screenshot for thumbnailing, decoding 8-bit PNGs with pyspng when it is installed."""
+    if PYSPNG_AVAILABLE and file_path.lower().endswith('.png'):
+        try:
+            with open(file_path, 'rb') as f:
+                pixels = pyspng.load(f.read())  # type: ignore
+            if pixels.dtype.name == 'uint8':
+                return Image.fromarray(pixels)  # type: ignore
+        except Exception:
+            pass  # Fall back to PIL's decoder
+    return Image.open(file_path)  # type: ignore
+
+
+def _render_thumbnail(file_path: str, width: int, height: int, quality: int) -> Optional[tuple[bytes, str]]:
+    """Generate a thumbnail with PIL and return it as encoded bytes (runs in a worker process)."""
+    try:
+        with _open_thumbnail_source(file_path) as img:
+            if img.width <= width and img.height <= height:
+                # Already thumbnail-sized: JPEGs are used as-is (PIL has only read the header),
+                # anything else is just re-encoded without resizing
+                if img.format == 'JPEG':
+                    with open(file_path, 'rb') as f:
+                        return f.read(), 'JPEG'
+                img_resized = img
+            else:
+                # JPEGs decode straight to a 1/2-1/8 scale that still covers twice the target,
+                # skipping most of the full-resolution decode; other formats ignore this
+                img.draft('RGB', (width * 2, height * 2))
+                img_ratio = img.width / img.height
+                target_ratio = width / height
+
+                if img_ratio > target_ratio:
+                    new_width = width
+                    new_height = int(width / img_ratio)
+                else:
+                    new_height = height
+                    new_width = int(height * img_ratio)
+
+                # reducing_gap box-reduces by an integer factor first, so Lanczos only runs
+                # over an image about 3x the thumbnail size instead of the full screenshot
+                img_resized = img.resize(
+                    (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0  # type: ignore
+                )
+
+            # Alpha is invisible at thumbnail size, and JPEG encodes far faster and smaller than PNG
+            if img_resized.mode != 'RGB':
+                img_resized = img_resized.convert('RGB')
+
+            from io import BytesIO
+            buffer = BytesIO()
+            img_resized.save(buffer, format='JPEG', quality=quality, optimize=False, progressive=False)
+
+            return buffer.getvalue(), 'JPEG'
+
+    except Exception:
+        return None
+
+
+def _thumbnail_cache_key(file_path: str, mtime_ns: int, width: int, height: int, quality: int) -> str:
+    """Return the disk cache name for a thumbnail; any change to the source or render settings gives a new key."""
+    return hashlib.blake2b(
+        f"{file_path}:{mtime_ns}:{width}x{height}:{quality}".encode(), digest_size=16
+    ).hexdigest()
+
+
+def _trim_thumbnail_disk_cache(cache_dir: Path, max_bytes: int) -> int:
+    """
+    Delete the least recently used thumbnails in cache_dir until it fits max_bytes.
+
+    Recency is the file's mtime, which cache hits refresh; atime is not reliable
+    (relatime/noatime mounts and Windows rarely update it). Returns the remaining size.
+    """
+    try:
+        entries = [(entry.stat(), entry) for entry in cache_dir.iterdir() if entry.is_file()]
+    except OSError:
+        return 0
+
+    total = sum(stat.st_size for stat, _ in entries)
+    if total <= max_bytes:
+        return total
+
+    for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime_ns):
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+        total -= stat.st_size
+        if total <= max_bytes:
+            break
+    return total
+
+
+def _load_or_render_thumbnail(
+    file_path: str, width: int, height: int, quality: int, cache_dir: Optional[str]
+) -> Optional[tuple[bytes, str, bool]]:
+    """
+    Return (bytes, format, stored) for a thumbnail (runs in a worker process).
+
+    With a cache_dir the thumbnail is read from the disk cache, or rendered and written
+    there on a miss; stored tells the caller a new file was added.
+    """
+    if cache_dir is None:
+        result = _render_thumbnail(file_path, width, height, quality)
+        return (*result, False) if result else None
+
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+
+    key = _thumbnail_cache_key(file_path, mtime_ns, width, height, quality)
+    cache_path = Path(cache_dir)
+
+    cached = cache_path / f"{key}.jpeg"
+    try:
+        image_bytes = cached.read_bytes()
+    except OSError:
+        pass
+    else:
+        try:
+            # Mark the hit as recently used for eviction
+            os.utime(cached)
+        except OSError:
+            pass
+        return image_bytes, 'JPEG', False
+
+    result = _render_thumbnail(file_path, width, height, quality)
+    if not result:
+        return None
+
+    image_bytes, format_str = result
+    try:
+        # Write to a temp file and rename so readers never see a partial thumbnail
+        cache_path.mkdir(parents=True, exist_ok=True)
+        target = cache_path / f"{key}.{format_str.lower()}"
+        temp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        temp.write_bytes(image_bytes)
+        os.replace(temp, target)
+    except OSError:
+        return image_bytes, format_str, False
+    return image_bytes, format_str, True
+
 
 class ThumbnailLoader(QObject):
     """Asynchronous thumbnail loading with caching and progressive loading."""
 
-    thumbnail_loaded = pyqtSignal(str, bytes, str)  # screenshot_id (now string), image_bytes, format
+    thumbnail_loaded = pyqtSignal(str, QPixmap)  # screenshot_id (now string), decoded thumbnail
     loading_failed = pyqtSignal(str, str)  # screenshot_id (now string), error_message
     loading_started = pyqtSignal(str)  # screenshot_id (now string) - emitted when loading begins
 
+    # Placeholders keyed by (width, height, text); QPixmap is implicitly shared, so one copy serves every item
+    _placeholders: Dict[Tuple[int, int, str], QPixmap] = {}
+
     def __init__(self, screenshot_manager: 'ScreenshotManager'):
         super().__init__()
         self.screenshot_manager = screenshot_manager
-        self._cache: Dict[str, tuple[bytes, str]] = {}  # Now uses string keys
-        self._loading_queue: list = []
-        self._is_processing = False
+        # Decoded thumbnails live in the application-wide, byte-bounded QPixmapCache
+        self._cached_ids: set = set()  # Screenshots this loader put in QPixmapCache
+        self._loading_queue: asyncio.Queue = asyncio.Queue()
+        self._workers: list = []  # One task per worker process, started with the first load
         self._loading_set: set = set()  # Track what's currently being loaded
-        self._max_concurrent_loads = 3  # Limit concurrent thumbnail generation
 
         # Optimization settings
         self._cache_enabled = True  # Enable caching by default
         self._max_cache_size = 100  # Maximum number of cached thumbnails
+        self.set_cache_size(self._max_cache_size)
         self._thumbnail_quality = 85  # JPEG quality (0-100)
 
-    async def load_thumbnail(self, screenshot_id: str, file_path: str, size: QSize = QSize(*THUMBNAIL_SIZE)):
+        # Generated thumbnails persist across runs, keyed by source path, mtime, size and quality
+        self._disk_cache_dir = Path(get_app_data_dir()) / "thumbnails"
+        self._disk_cache_writes = 0  # Writes since the last size trim
+
+    async def load_thumbnail(self, screenshot_id: str, file_path: str, size: QSize = QSize(*THUMBNAIL_DISPLAY_SIZE)):
         """Queue thumbnail loading with immediate placeholder emission."""
+        self._enqueue(screenshot_id, file_path, size)
+        self._start_workers()
+
+    async def load_thumbnails(self, entries: Iterable[Tuple[str, str]], size: QSize = QSize(*THUMBNAIL_DISPLAY_SIZE)):
+        """Queue thumbnails for several (screenshot_id, file_path) pairs and start processing once."""
+        for screenshot_id, file_path in entries:
+            self._enqueue(screenshot_id, file_path, size)
+        self._start_workers()
+
+    def _enqueue(self, screenshot_id: str, file_path: str, size: QSize) -> None:
+        """Emit a cached thumbnail, or queue it for generation unless it is already loading."""
         # Check cache first (only if caching is enabled)
-        if self._cache_enabled and screenshot_id in self._cache:
-            self.thumbnail_loaded.emit(screenshot_id, self._cache[screenshot_id][0], self._cache[screenshot_id][1])
-            return
+        if self._cache_enabled:
+            pixmap = QPixmapCache.find(self._pixmap_key(screenshot_id))
+            if pixmap is not None:
+                self.thumbnail_loaded.emit(screenshot_id, pixmap)
+                return
 
         # Check if already loading
         if screenshot_id in self._loading_set:
@@ -77,79 +283,69 @@ class ThumbnailLoader(QObject):
         self.loading_started.emit(screenshot_id)
 
         # Queue for processing
-        self._loading_queue.append((screenshot_id, file_path, size))
-
-        # Start processing if not already running
-        if not self._is_processing:
-            asyncio.create_task(self._process_queue())
-
-    async def _process_queue(self):
-        """Process the thumbnail loading queue with concurrency control."""
-        if self._is_processing:
-            return
-
-        self._is_processing = True
-        concurrent_tasks = []
+        self._loading_queue.put_nowait((screenshot_id, file_path, size))
+
+    def _start_workers(self) -> None:
+        """Start the queue workers unless they are already running."""
+        if not self._workers:
+            # One in-flight thumbnail per worker process
+            self._workers = [asyncio.create_task(self._worker_loop()) for _ in range(THUMBNAIL_WORKERS)]
+
+    async def _worker_loop(self):
+        """Generate queued thumbnails one at a time until cancelled."""
+        while True:
+            screenshot_id, file_path, size = await self._loading_queue.get()
+            try:
+                await self._generate_thumbnail(screenshot_id, file_path, size)
+            except Exception as e:
+                logger.warning(f"Thumbnail generation task failed: {e}")
+            finally:
+                self._loading_queue.task_done()
 
-        try:
-            while self._loading_queue or concurrent_tasks:
-                # Start new tasks up to the limit
-                while len(concurrent_tasks) < self._max_concurrent_loads and self._loading_queue:
-                    screenshot_id, file_path, size = self._loading_queue.pop(0)
-                    task = asyncio.create_task(self._generate_thumbnail(screenshot_id, file_path, size))
-                    concurrent_tasks.append(task)
-
-                # Wait for at least one task to complete
-                if concurrent_tasks:
-                    done, pending = await asyncio.wait(concurrent_tasks, return_when=asyncio.FIRST_COMPLETED)
-                    concurrent_tasks = list(pending)
-
-                    # Process completed tasks
-                    for task in done:
-                        try:
-                            await task
-                        except Exception as e:
-                            logger.warning(f"Thumbnail generation task failed: {e}")
-
-                # Small delay to prevent overwhelming the UI
-                await asyncio.sleep(0.001)
-
-        finally:
-            self._is_processing = False
+    def stop(self) -> None:
+        """Cancel the queue workers."""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
 
     async def _generate_thumbnail(self, screenshot_id: str, file_path: str, size: QSize):
         """Generate thumbnail for a screenshot."""
         try:
             if not PIL_AVAILABLE:
-                placeholder = self._create_placeholder(size, "No PIL")
-                self.thumbnail_loaded.emit(screenshot_id, self._pixmap_to_bytes(placeholder), "PNG")
+                self.thumbnail_loaded.emit(screenshot_id, self._create_placeholder(size, "No PIL"))
                 return
 
             try:
                 loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(None, self._pil_thumbnail_bytes, file_path, size)
+                cache_dir = str(self._disk_cache_dir) if self._cache_enabled else None
+                result = await loop.run_in_executor(
+                    _get_thumbnail_pool(), _load_or_render_thumbnail,
+                    file_path, size.width(), size.height(), self._thumbnail_quality, cache_dir
+                )
 
                 if result:
-                    image_bytes, format_str = result
+                    image_bytes, format_str, stored = result
+                    if stored:
+                        await self._count_disk_cache_write()
                     # Log thumbnail size
                     size_kb = len(image_bytes) / 1024
                     logger.debug(f"Generated thumbnail for {screenshot_id[:8]}: {len(image_bytes)} bytes ({size_kb:.1f} KB), format: {format_str}, quality: {self._thumbnail_quality}")
 
-                    # Cache the result if caching is enabled
-                    if self._cache_enabled:
-                        # Check if cache is full and remove oldest entry if needed
-                        if len(self._cache) >= self._max_cache_size:
-                            # Remove the first (oldest) entry
-                            oldest_key = next(iter(self._cache))
-                            del self._cache[oldest_key]
-                        self._cache[screenshot_id] = (image_bytes, format_str)
-                    self.thumbnail_loaded.emit(screenshot_id, image_bytes, format_str)
+                    # Decode on a worker thread (QImage is thread-safe); only the pixmap conversion runs on the GUI thread
+                    image = await loop.run_in_executor(None, QImage.fromData, image_bytes, format_str)
+                    if image.isNull():
+                        raise Exception("Failed to decode thumbnail")
+                    pixmap = QPixmap.fromImage(image)
+
+                    # Cache the result if caching is enabled (QPixmapCache evicts least recently used)
+                    if self._cache_enabled and QPixmapCache.insert(self._pixmap_key(screenshot_id), pixmap):
+                        self._cached_ids.add(screenshot_id)
+                    self.thumbnail_loaded.emit(screenshot_id, pixmap)
                 else:
                     raise Exception("Failed to create thumbnail")
 
             except Exception as e:
-                placeholder = self._create_placeholder(size, "Error")
-                self.thumbnail_loaded.emit(screenshot_id, self._pixmap_to_bytes(placeholder), "PNG")
+                self.thumbnail_loaded.emit(screenshot_id, self._create_placeholder(size, "Error"))
                 logger.warning(f"Thumbnail generation failed for {file_path}: {e}")
                 raise
 
@@ -157,57 +353,46 @@ class ThumbnailLoader(QObject):
             # Remove from loading set when done (success or failure)
             self._loading_set.discard(screenshot_id)
 
-    def _pil_thumbnail_bytes(self, file_path: str, size: QSize) -> Optional[tuple[bytes, str]]:
-        """Generate thumbnail using PIL and return as bytes."""
-        try:
-            with Image.open(file_path) as img:  # type: ignore
-                img_ratio = img.width / img.height
-                target_ratio = size.width() / size.height()
-
-                if img_ratio > target_ratio:
-                    new_width = size.width()
-                    new_height = int(size.width() / img_ratio)
-                else:
-                    new_height = size.height()
-                    new_width = int(size.height() * img_ratio)
-
-                img_resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)  # type: ignore
-
-                if img_resized.mode not in ('RGB', 'RGBA'):
-                    img_resized = img_resized.convert('RGB')
-
-                from io import BytesIO
-                buffer = BytesIO()
-                if img_resized.mode == 'RGBA':
-                    format_str = 'PNG'
-                    img_resized.save(buffer, format=format_str)
-                else:
-                    format_str = 'JPEG'
-                    img_resized.save(buffer, format=format_str, quality=self._thumbnail_quality)
-
-                image_bytes = buffer.getvalue()
-                size_kb = len(image_bytes) / 1024
-                logger.debug(f"PIL thumbnail created: {len(image_bytes)} bytes ({size_kb:.1f} KB), format: {format_str}, dimensions: {new_width}x{new_height}, quality: {self._thumbnail_quality}")
+    async def prewarm(self, file_path: str, size: QSize = QSize(*THUMBNAIL_DISPLAY_SIZE)) -> None:
+        """Render a new screenshot's thumbnail into the disk cache so the gallery only has to read it."""
+        if not PIL_AVAILABLE or not self._cache_enabled:
+            return
 
-                return image_bytes, format_str
+        try:
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                _get_thumbnail_pool(), _load_or_render_thumbnail,
+                file_path, size.width(), size.height(), self._thumbnail_quality, str(self._disk_cache_dir)
+            )
+            if result and result[2]:
+                await self._count_disk_cache_write()
+        except Exception as e:
+            logger.warning(f"Thumbnail prewarm failed for {file_path}: {e}")
+
+    async def _count_disk_cache_write(self) -> None:
+        """Record a disk cache write and trim the cache every few writes."""
+        self._disk_cache_writes += 1
+        if self._disk_cache_writes >= THUMBNAIL_DISK_CACHE_TRIM_INTERVAL:
+            self._disk_cache_writes = 0
+            await asyncio.get_event_loop().run_in_executor(None, self._trim_disk_cache)
+
+    def _trim_disk_cache(self) -> None:
+        """Delete the least recently used disk thumbnails until the cache fits its byte budget."""
+        total = _trim_thumbnail_disk_cache(self._disk_cache_dir, THUMBNAIL_DISK_CACHE_MAX_BYTES)
+        logger.debug(f"Thumbnail disk cache is {total / (1024 * 1024):.1f} MB")
+
+    @classmethod
+    def _create_placeholder(cls, size: QSize, text: str = "Loading") -> QPixmap:
+        """Return a placeholder pixmap, painting it only the first time a size and text are requested."""
+        key = (size.width(), size.height(), text)
+        pixmap = cls._placeholders.get(key)
+        if pixmap is None:
+            pixmap = cls._placeholders[key] = cls._paint_placeholder(size, text)
+        return pixmap
 
-        except Exception:
-            logger.warning(f"PIL thumbnail generation failed for {file_path}")
-            return None
-
-    def _pixmap_to_bytes(self, pixmap: QPixmap) -> bytes:
-        """Convert QPixmap to bytes."""
-        image = pixmap.toImage()
-        buffer = QBuffer()
-        buffer.open(QBuffer.OpenModeFlag.WriteOnly)
-        image.save(buffer, "PNG")
-        image_bytes = buffer.data().data()
-        size_kb = len(image_bytes) / 1024
-        logger.debug(f"Placeholder thumbnail created: {len(image_bytes)} bytes ({size_kb:.1f} KB), format: PNG")
-        return image_bytes
-
-    def _create_placeholder(self, size: QSize, text: str = "Loading") -> QPixmap:
-        """Create a placeholder pixmap."""
+    @staticmethod
+    def _paint_placeholder(size: QSize, text: str) -> QPixmap:
+        """Paint a placeholder pixmap."""
         pixmap = QPixmap(size)
         pixmap.fill(QColor(70, 70, 70))
 
@@ -219,24 +404,35 @@ class ThumbnailLoader(QObject):
 
         return pixmap
 
+    @staticmethod
+    def _pixmap_key(screenshot_id: str) -> str:
+        """QPixmapCache key for a screenshot's thumbnail."""
+        return f"thumbnail:{screenshot_id}"
+
+    def _clear_pixmaps(self) -> None:
+        """Remove this loader's thumbnails from QPixmapCache."""
+        for screenshot_id in self._cached_ids:
+            QPixmapCache.remove(self._pixmap_key(screenshot_id))
+        self._cached_ids.clear()
+
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether rendered thumbnails are kept in the pixmap and disk caches."""
+        return self._cache_enabled
+
     def set_cache_enabled(self, enabled: bool) -> None:
         """Enable or disable thumbnail caching."""
         self._cache_enabled = enabled
         if not enabled:
             # Clear cache when disabling
-            self._cache.clear()
+            self._clear_pixmaps()
         logger.debug(f"Thumbnail cache enabled set to: {enabled}")
 
     def set_cache_size(self, max_size: int) -> None:
-        """Set maximum cache size (number of thumbnails)."""
+        """Set maximum cache size (number of thumbnails), applied as a QPixmapCache byte limit."""
         self._max_cache_size = max_size
-        # Trim cache if it's now over the limit
-        if len(self._cache) > max_size:
-            # Remove oldest entries (simple FIFO approach)
-            items_to_remove = len(self._cache) - max_size
-            keys_to_remove = list(self._cache.keys())[:items_to_remove]
-            for key in keys_to_remove:
-                del self._cache[key]
+        # QPixmapCache evicts least recently used pixmaps itself once over the limit
+        QPixmapCache.setCacheLimit(_QT_PIXMAP_CACHE_KB + max_size * _THUMBNAIL_PIXMAP_KB)
         logger.debug(f"Thumbnail cache size set to: {max_size}")
 
     def set_quality(self, quality: int) -> None:
@@ -246,13 +442,14 @@ class ThumbnailLoader(QObject):
 
     async def clear_cache(self) -> None:
         """Clear the thumbnail cache."""
-        self._cache.clear()
+        self._clear_pixmaps()
         logger.debug("Thumbnail cache cleared")
 
     def remove_from_cache(self, screenshot_id: str) -> None:
         """Remove a specific thumbnail from the cache."""
-        if screenshot_id in self._cache:
-            del self._cache[screenshot_id]
+        if screenshot_id in self._cached_ids:
+            self._cached_ids.discard(screenshot_id)
+            QPixmapCache.remove(self._pixmap_key(screenshot_id))
             logger.debug(f"Removed thumbnail from cache for screenshot: {screenshot_id[:8]}")
 
 
@@ -261,6 +458,8 @@ class ScreenshotItem(QWidget):
 
     clicked = pyqtSignal(str)  # screenshot_id (now hash-based string)
 
+    _loading_placeholder: Optional[QPixmap] = None  # Painted once, shared by all items
+
     def __init__(self, screenshot_id: str, filename: str, timestamp: datetime, parent=None):
         super().__init__(parent)
         self.screenshot_id = screenshot_id
@@ -310,8 +509,16 @@ class ScreenshotItem(QWidget):
         placeholder = self._create_loading_placeholder()
         self.thumbnail_label.setPixmap(placeholder)
 
-    def _create_loading_placeholder(self) -> QPixmap:
-        """Create a loading placeholder pixmap with animation-ready styling."""
+    @classmethod
+    def _create_loading_placeholder(cls) -> QPixmap:
+        """Return the loading placeholder pixmap shared by all items, painting it on first use."""
+        if cls._loading_placeholder is None:
+            cls._loading_placeholder = cls._paint_loading_placeholder()
+        return cls._loading_placeholder
+
+    @staticmethod
+    def _paint_loading_placeholder() -> QPixmap:
+        """Paint a loading placeholder pixmap with animation-ready styling."""
         pixmap = QPixmap(120, 120)
         pixmap.fill(QColor(50, 50, 50))  # Dark gray background
 
@@ -341,7 +548,9 @@ class ScreenshotItem(QWidget):
 
     def _truncate_filename(self, filename: str, max_length: int = MAX_FILENAME_LENGTH) -> str:
         """Truncate filename for display."""
-        name_without_ext = os.path.splitext(filename)[0]
+        # Same result as os.path.splitext for bare filenames, without the extra call
+        dot = filename.rfind('.')
+        name_without_ext = filename[:dot] if dot > 0 else filename
         if len(name_without_ext) <= max_length:
             return name_without_ext
         return name_without_ext[:max_length - 3] + "..."
@@ -349,12 +558,15 @@ class ScreenshotItem(QWidget):
     def set_thumbnail(self, pixmap: QPixmap):
         """Set the thumbnail pixmap and mark loading as complete."""
         self._is_loading = False
-        scaled = pixmap.scaled(
-            *THUMBNAIL_DISPLAY_SIZE,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.thumbnail_label.setPixmap(scaled)
+        # ThumbnailLoader already renders at display size; only rescale anything larger
+        width, height = THUMBNAIL_DISPLAY_SIZE
+        if pixmap.width() > width or pixmap.height() > height:
+            pixmap = pixmap.scaled(
+                width, height,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+        self.thumbnail_label.setPixmap(pixmap)
 
     def set_selected(self, selected: bool):
         """Set selection state."""
@@ -401,6 +613,11 @@ class ScreenshotGallery(QWidget):
         self.screenshot_items: Dict[str, ScreenshotItem] = {}  # Now uses string keys
         self._screenshot_item_style_manager: Optional[ScreenshotItemStyleManager] = None
         self._selected_screenshot_id: Optional[str] = None  # Now string-based
+        self._pending_select_id: Optional[str] = None  # Latest click not yet handled
+        self._select_task: Optional[asyncio.Task] = None
+        self._screenshots: list = []  # All listed screenshots, newest first
+        self._built_count = 0  # Leading entries of _screenshots that have a grid item
+        self._preload_count = 5  # Thumbnails queued ahead of the last built item
 
         self.setObjectName("ScreenshotGallery")
         self._setup_ui()
@@ -437,6 +654,12 @@ class ScreenshotGallery(QWidget):
         self.screenshots_scroll.setWidget(self.screenshots_container)
         layout.addWidget(self.screenshots_scroll)
 
+        # Items are built in batches as the user scrolls towards the end (or while the view is not yet full)
+        scrollbar = self.screenshots_scroll.verticalScrollBar()
+        if scrollbar:
+            scrollbar.valueChanged.connect(self._build_more_if_near_end)
+            scrollbar.rangeChanged.connect(self._build_more_if_near_end)
+
     def set_style_manager(self, style_manager: 'ScreenshotItemStyleManager') -> None:
         """Set the style manager for screenshot items."""
         self._screenshot_item_style_manager = style_manager
@@ -456,40 +679,10 @@ class ScreenshotGallery(QWidget):
             screenshots = await self.screenshot_manager.get_recent_screenshots(limit=limit)
 
             self._clear_screenshot_items()
+            self._screenshots = self._order_screenshots(screenshots)
 
-            row, col = 0, 0
-
-            # Sort screenshots by timestamp, newest first
-            screenshots_sorted = sorted(screenshots, key=lambda s: s.timestamp, reverse=True)
-
-            for screenshot in screenshots_sorted:
-                # Use hash as unique identifier instead of database ID
-                screenshot_hash = screenshot.hash or screenshot.unique_id
-                if screenshot_hash:
-                    item = ScreenshotItem(
-                        screenshot_hash,
-                        screenshot.filename,
-                        screenshot.timestamp
-                    )
-                    item.clicked.connect(self._on_screenshot_clicked)
-
-                    if self._screenshot_item_style_manager:
-                        item.set_style_manager(self._screenshot_item_style_manager)
-
-                    self.screenshots_layout.addWidget(item, row, col)
-                    self.screenshot_items[screenshot_hash] = item
-
-                    # Queue thumbnail loading (this will show placeholder immediately)
-                    if self.thumbnail_loader:
-                        await self.thumbnail_loader.load_thumbnail(
-                            screenshot_hash,
-                            screenshot.full_path
-                        )
-
-                col += 1
-                if col >= GRID_COLS_PER_ROW:
-                    col = 0
-                    row += 1
+            # Only the first rows get widgets now; the rest are built as the user scrolls
+            self._build_items(INITIAL_SCREENSHOT_ITEMS)
 
             logger.debug(f"Loaded {len(screenshots)} screenshots")
 
@@ -508,88 +701,115 @@ class ScreenshotGallery(QWidget):
             else:
                 screenshots = await self.screenshot_manager.get_recent_screenshots(limit=limit)
 
+            ordered = self._order_screenshots(screenshots)
+
             # Build set of current screenshot hashes for comparison
-            current_hashes = {screenshot.hash or screenshot.unique_id for screenshot in screenshots if screenshot.hash or screenshot.unique_id}
-            existing_hashes = set(self.screenshot_items.keys())
+            current_hashes = {screenshot.hash or screenshot.unique_id for screenshot in ordered}
+            known_hashes = {screenshot.hash or screenshot.unique_id for screenshot in self._screenshots}
 
             # Find screenshots to add and remove
-            to_add = current_hashes - existing_hashes
-            to_remove = existing_hashes - current_hashes
+            to_add = current_hashes - known_hashes
+            to_remove = known_hashes - current_hashes
 
             # Remove screenshots that are no longer present
             for hash_to_remove in to_remove:
                 if hash_to_remove in self.screenshot_items:
-                    item = self.screenshot_items[hash_to_remove]
+                    item = self.screenshot_items.pop(hash_to_remove)
                     self.screenshots_layout.removeWidget(item)
                     item.hide()  # Fix ghosting in layout
                     item.deleteLater()
-                    del self.screenshot_items[hash_to_remove]
 
-                    # Remove thumbnail from cache since the file no longer exists
-                    if self.thumbnail_loader:
-                        self.thumbnail_loader.remove_from_cache(hash_to_remove)
+                # Remove thumbnail from cache since the file no longer exists
+                if self.thumbnail_loader:
+                    self.thumbnail_loader.remove_from_cache(hash_to_remove)
 
-            # Update the layout after removals
-            if to_remove:
-                self.screenshots_container.update()
+            self._screenshots = ordered
 
-            # If we have new screenshots to add, reorganize the entire grid to maintain newest-first order
-            if to_add:
-                # Get all screenshots with their timestamps for sorting
-                all_current_screenshots = []
-                for screenshot in screenshots:
-                    screenshot_hash = screenshot.hash or screenshot.unique_id
-                    if screenshot_hash:
-                        all_current_screenshots.append(screenshot)
-
-                # Sort by timestamp, newest first
-                all_current_screenshots.sort(key=lambda s: s.timestamp, reverse=True)
+            # Rebuild the grid in newest-first order, keeping every item the user had already scrolled to
+            if to_add or to_remove:
+                built = [
+                    index for index, screenshot in enumerate(ordered)
+                    if (screenshot.hash or screenshot.unique_id) in self.screenshot_items
+                ]
+                target = max(INITIAL_SCREENSHOT_ITEMS, built[-1] + 1 if built else 0)
 
                 # Clear the layout but keep the items
-                for hash_id, item in self.screenshot_items.items():
+                for item in self.screenshot_items.values():
                     self.screenshots_layout.removeWidget(item)
 
-                # Create new screenshot items for those that need to be added
-                for screenshot in all_current_screenshots:
-                    screenshot_hash = screenshot.hash or screenshot.unique_id
-                    if screenshot_hash and screenshot_hash in to_add:
-                        item = ScreenshotItem(
-                            screenshot_hash,
-                            screenshot.filename,
-                            screenshot.timestamp
-                        )
-                        item.clicked.connect(self._on_screenshot_clicked)
-
-                        if self._screenshot_item_style_manager:
-                            item.set_style_manager(self._screenshot_item_style_manager)
-
-                        self.screenshot_items[screenshot_hash] = item
-
-                        # Queue thumbnail loading
-                        if self.thumbnail_loader:
-                            await self.thumbnail_loader.load_thumbnail(
-                                screenshot_hash,
-                                screenshot.full_path
-                            )
-
-                # Re-add all items to layout in correct order (newest first)
-                row, col = 0, 0
-                for screenshot in all_current_screenshots:
-                    screenshot_hash = screenshot.hash or screenshot.unique_id
-                    if screenshot_hash and screenshot_hash in self.screenshot_items:
-                        item = self.screenshot_items[screenshot_hash]
-                        self.screenshots_layout.addWidget(item, row, col)
-
-                        col += 1
-                        if col >= GRID_COLS_PER_ROW:
-                            col = 0
-                            row += 1
+                self._built_count = 0
+                self._build_items(target)
 
             logger.debug(f"Refreshed screenshots: {len(to_add)} added, {len(to_remove)} removed")
 
         except Exception as e:
             logger.error(f"Failed to refresh screenshots: {e}")
 
+    @staticmethod
+    def _order_screenshots(screenshots) -> list:
+        """Return the screenshots that have an identifier, newest first."""
+        # Use hash as unique identifier instead of database ID
+        return sorted(
+            (screenshot for screenshot in screenshots if screenshot.hash or screenshot.unique_id),
+            key=lambda s: s.timestamp,
+            reverse=True
+        )
+
+    def _build_items(self, count: int) -> None:
+        """Lay out grid items for the first count screenshots, creating widgets not built yet."""
+        thumbnails = []  # (screenshot_id, file_path) pairs queued in one batch below
+
+        # Repaint once after the whole batch is laid out
+        self.screenshots_container.setUpdatesEnabled(False)
+        try:
+            for index in range(self._built_count, min(count, len(self._screenshots))):
+                screenshot = self._screenshots[index]
+                screenshot_hash = screenshot.hash or screenshot.unique_id
+
+                item = self.screenshot_items.get(screenshot_hash)
+                if item is None:
+                    item = ScreenshotItem(
+                        screenshot_hash,
+                        screenshot.filename,
+                        screenshot.timestamp
+                    )
+                    item.clicked.connect(self._on_screenshot_clicked)
+
+                    if self._screenshot_item_style_manager:
+                        item.set_style_manager(self._screenshot_item_style_manager)
+                    if screenshot_hash == self._selected_screenshot_id:
+                        item.set_selected(True)
+
+                    self.screenshot_items[screenshot_hash] = item
+                    thumbnails.append((screenshot_hash, screenshot.full_path))
+
+                self.screenshots_layout.addWidget(item, index // GRID_COLS_PER_ROW, index % GRID_COLS_PER_ROW)
+                self._built_count = index + 1
+        finally:
+            self.screenshots_container.setUpdatesEnabled(True)
+
+        # Queued after the built items, so the next rows are decoded before they are scrolled to;
+        # without the caches a preloaded thumbnail would just be rendered again when its item is built
+        if thumbnails and self.thumbnail_loader and self.thumbnail_loader.cache_enabled:
+            thumbnails.extend(
+                (screenshot.hash or screenshot.unique_id, screenshot.full_path)
+                for screenshot in self._screenshots[self._built_count:self._built_count + self._preload_count]
+            )
+
+        # Queue thumbnail loading (items already show a loading placeholder)
+        if thumbnails and self.thumbnail_loader:
+            asyncio.create_task(self.thumbnail_loader.load_thumbnails(thumbnails))
+
+    def _build_more_if_near_end(self, *_) -> None:
+        """Build the next batch of items once the view is within a viewport of the last built row."""
+        if self._built_count >= len(self._screenshots):
+            return
+
+        scrollbar = self.screenshots_scroll.verticalScrollBar()
+        viewport = self.screenshots_scroll.viewport()
+        if scrollbar and viewport and scrollbar.value() >= scrollbar.maximum() - viewport.height():
+            self._build_items(self._built_count + SCREENSHOT_ITEMS_BATCH)
+
     async def force_directory_refresh(self, limit: int = 150):
         """Force a fresh directory scan and full refresh of screenshots."""
         try:
@@ -613,12 +833,12 @@ class ScreenshotGallery(QWidget):
             current_screenshots = await self.screenshot_manager.get_recent_screenshots(limit=200)
             screenshot_paths = {(s.hash or s.unique_id): s.full_path for s in current_screenshots}
 
-            # Reload thumbnails for all currently displayed screenshot items
-            for screenshot_id, item in self.screenshot_items.items():
-                if screenshot_id in screenshot_paths:
-                    file_path = screenshot_paths[screenshot_id]
-                    # Queue thumbnail loading which will regenerate with new settings
-                    await self.thumbnail_loader.load_thumbnail(screenshot_id, file_path)
+            # Reload thumbnails for all currently displayed screenshot items (regenerated with new settings)
+            await self.thumbnail_loader.load_thumbnails(
+                (screenshot_id, screenshot_paths[screenshot_id])
+                for screenshot_id in self.screenshot_items
+                if screenshot_id in screenshot_paths
+            )
 
             logger.debug(f"Queued thumbnail refresh for {len(self.screenshot_items)} screenshots")
 
@@ -655,11 +875,22 @@ class ScreenshotGallery(QWidget):
         for item in self.screenshot_items.values():
             item.deleteLater()
         self.screenshot_items.clear()
+        self._screenshots = []
+        self._built_count = 0
 
     async def select_screenshot(self, screenshot_id: str):
         """Select a screenshot and update UI state."""
-        for item in self.screenshot_items.values():
-            item.set_selected(False)
+        if screenshot_id not in self.screenshot_items:
+            # The screenshot may be listed but not scrolled to yet
+            for index, screenshot in enumerate(self._screenshots):
+                if (screenshot.hash or screenshot.unique_id) == screenshot_id:
+                    self._build_items(index + 1)
+                    break
+
+        # Only the previously selected item can need deselecting
+        previous = self.screenshot_items.get(self._selected_screenshot_id)
+        if previous:
+            previous.set_selected(False)
 
         if screenshot_id in self.screenshot_items:
             self.screenshot_items[screenshot_id].set_selected(True)
@@ -687,14 +918,20 @@ class ScreenshotGallery(QWidget):
                     style.polish(self.selection_indicator)
 
     def _on_screenshot_clicked(self, screenshot_id: str):
-        """Handle screenshot item clicks."""
-        asyncio.create_task(self.select_screenshot(screenshot_id))
-
-    def _on_thumbnail_loaded(self, screenshot_id: str, image_bytes: bytes, format_str: str):
+        """Handle screenshot item clicks, coalescing bursts into the latest selection."""
+        self._pending_select_id = screenshot_id
+        if self._select_task is None or self._select_task.done():
+            self._select_task = asyncio.create_task(self._drain_pending_selection())
+
+    async def _drain_pending_selection(self):
+        """Select the most recently clicked screenshot until no newer click is pending."""
+        while self._pending_select_id is not None:
+            screenshot_id, self._pending_select_id = self._pending_select_id, None
+            await self.select_screenshot(screenshot_id)
+
+    def _on_thumbnail_loaded(self, screenshot_id: str, pixmap: QPixmap):
         """Handle thumbnail loading completion."""
         if screenshot_id in self.screenshot_items:
-            pixmap = QPixmap()
-            pixmap.loadFromData(image_bytes, format_str.upper())
             self.screenshot_items[screenshot_id].set_thumbnail(pixmap)
 
     def _on_thumbnail_loading_started(self, screenshot_id: str):
@@ -745,6 +982,11 @@ class ScreenshotGallery(QWidget):
         except Exception as e:
             logger.error(f"Error updating thumbnail cache size: {e}")
 
+    def update_preload_count(self, count: int) -> None:
+        """Update how many thumbnails are loaded ahead of the built items."""
+        self._preload_count = count
+        logger.debug(f"Thumbnail preload count updated to: {count}")
+
     async def update_thumbnail_quality(self, quality: int):
         """Update thumbnail quality setting."""
         try:
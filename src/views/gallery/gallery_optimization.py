@@ -8,7 +8,7 @@ for the gallery window to improve performance and user experience.
 import logging
 from typing import Optional, Dict, Any, List, TYPE_CHECKING
 from PyQt6.QtCore import QObject, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtGui import QImage, QPixmap
 
 if TYPE_CHECKING:
     from .gallery_window import GalleryWindow
@@ -154,14 +154,12 @@ class OptimizedThumbnailLoader(QObject):
                 qimage = ImageQt.ImageQt(pil_image)
                 return QPixmap.fromImage(qimage)
             except ImportError:
-                # Fallback: save to bytes and load
-                import io
-                buffer = io.BytesIO()
-                pil_image.save(buffer, format='PNG')
-                buffer.seek(0)
-                pixmap = QPixmap()
-                pixmap.loadFromData(buffer.getvalue())
-                return pixmap
+                # Fallback: wrap the raw RGBA pixels instead of encoding and decoding a PNG
+                rgba = pil_image.convert('RGBA')
+                data = rgba.tobytes()
+                qimage = QImage(data, rgba.width, rgba.height, rgba.width * 4, QImage.Format.Format_RGBA8888)
+                # fromImage copies the pixels, so the QImage may not outlive data
+                return QPixmap.fromImage(qimage)
 
         except Exception as e:
             self.logger.error(f"Error converting PIL image to QPixmap: {e}")
@@ -6,13 +6,20 @@ Implements the main gallery interface for screenshot management, AI chat, and pr
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import inspect
 import logging
+import time
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QFileSystemWatcher, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QSplitter, QFrame
+    QWidget, QVBoxLayout, QSplitter
 )
 
 from src.utils.style_loader import (
@@ -20,11 +27,12 @@ from src.utils.style_loader import (
     ScreenshotItemStyleManager, PresetItemStyleManager
 )
 from src.utils.icon_manager import get_icon_manager
+from src.models.chat_history_manager import ChatHistoryManager, ChatMessage as ChatHistoryMessage
 from src import EventTypes
 
 from .components import (
     CustomTitleBar, ChatInterface, ScreenshotGallery,
-    PresetsPanel, GalleryState, PresetData
+    PresetsPanel, GalleryState, PresetData, TTLCache, shutdown_thumbnail_pool
 )
 
 if TYPE_CHECKING:
@@ -36,6 +44,116 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Handle returned when scheduling work on the gallery's event loop
+ScheduledFuture = Union[asyncio.Future, concurrent.futures.Future]
+
+# Lifetime of cached gallery content and UI state; only a safety net, since
+# staleness is tracked by event- and file-system-driven invalidation
+CACHE_TTL_SECONDS = 3600
+
+# Window for coalescing bursts of capture/preset events into one refresh
+REFRESH_DEBOUNCE_DELAY = 0.1
+
+# Setting keys forwarded to gallery components through the settings flush
+_SCREENSHOT_KEYS = frozenset({'screenshot.thumbnail_size', 'screenshot.image_format', 'screenshot.quality'})
+_OLLAMA_KEYS = frozenset({'ollama.server_url', 'ollama.default_model',
+                          'ollama.max_retries', 'ollama.enable_streaming'})
+_OPT_PREFIX = 'optimization.'
+
+# Marker for settings that have not been applied yet
+_UNSET = object()
+
+# Minimum interval between opacity updates (one frame at 60 Hz)
+OPACITY_APPLY_INTERVAL_MS = 16
+
+# Interval at which streamed response tokens are drawn into the chat (~30 Hz)
+STREAM_FLUSH_INTERVAL_MS = 33
+
+# Window for batching chat messages sent in quick succession into one history write
+HISTORY_FLUSH_DELAY = 0.05
+
+# Short background loads the gallery runs at once (see _spawn); further loads wait for a free slot
+MAX_CONCURRENT_TASKS = 8
+
+# Window for coalescing bursts of settings updates into a single apply pass
+SETTINGS_FLUSH_DELAY = 0.05
+
+
+# Chat history roles mapped to chat interface senders
+_CHAT_SENDERS = {'user': 'user', 'assistant': 'ai', 'system': 'system'}
+
+# EventBus subscriptions as (event type, handler method name, priority)
+_SUBSCRIPTIONS = (
+    # Ollama responses and streaming updates
+    (EventTypes.OLLAMA_RESPONSE_RECEIVED, '_handle_ollama_response', 90),
+    ("ollama.streaming.update", '_handle_streaming_update', 90),
+
+    # Settings updates
+    (EventTypes.SETTINGS_UPDATED, '_handle_settings_updated', 80),
+
+    # Screenshot events
+    (EventTypes.SCREENSHOT_CAPTURED, '_handle_screenshot_captured', 75),
+    (EventTypes.SCREENSHOT_COMPLETED, '_handle_screenshot_completed', 75),
+    ("screenshot.directory_changed", '_handle_screenshot_directory_changed', 75),
+
+    # Preset events
+    (EventTypes.PRESET_CREATED, '_handle_preset_created', 70),
+    (EventTypes.PRESET_UPDATED, '_handle_preset_updated', 70),
+    (EventTypes.PRESET_DELETED, '_handle_preset_deleted', 70),
+
+    # Application state changes and errors
+    (EventTypes.APP_STATE_CHANGED, '_handle_app_state_changed', 60),
+    (EventTypes.ERROR_OCCURRED, '_handle_error_occurred', 50),
+)
+
+
+class CacheKind(IntEnum):
+    """Gallery caches that can be invalidated individually (value indexes GalleryWindow._caches)."""
+    PRESETS = 0
+    THUMBNAILS = 1
+    UI_STATE = 2
+
+
+def _event_value(event_data, key: str) -> Any:
+    """Return event_data.data[key], or None when the event carries no such value."""
+    data = event_data.data
+    return data.get(key) if data else None
+
+
+def log_errors(message: str):
+    """
+    Decorator that logs exceptions raised by a gallery handler instead of propagating them.
+
+    The message may reference the handler's parameters by name, e.g. "({key})".
+    Works for both plain and async methods.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def log(e: Exception, args, kwargs) -> None:
+            bound = signature.bind_partial(*args, **kwargs)
+            bound.apply_defaults()
+            logger.error(f"{message.format(**bound.arguments)}: {e}")
+
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    log(e, args, kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                log(e, args, kwargs)
+        return wrapper
+
+    return decorator
+
 
 class GalleryWindow(QWidget):
     """Main gallery window with three-column layout using coordinated components."""
@@ -46,6 +164,9 @@ class GalleryWindow(QWidget):
     chat_message_sent = pyqtSignal(str, dict)  # message, context
     gallery_closed = pyqtSignal()
 
+    # Application icon shared by all gallery windows
+    _cached_app_icon: ClassVar[Optional[QIcon]] = None
+
     def __init__(
         self,
         event_bus: 'EventBus',
@@ -71,535 +192,642 @@ class GalleryWindow(QWidget):
         self._content_loaded = False  # Track if content has been loaded
         self._current_theme = "dark"  # Default theme, will be loaded from settings
 
-        # Cache system for performance optimization
-        self._screenshot_cache = {}  # Cache for screenshot metadata
-        self._preset_cache = {}  # Cache for preset data
-        self._thumbnail_cache = {}  # Cache for thumbnail paths/data
-        self._ui_state_cache = {}  # Cache for UI state preservation
-        self._cache_timestamp = None  # Track when cache was last updated
-        self._cache_expiry_seconds = 300  # Cache expires after 5 minutes
+        # Cache system for performance optimization (entries expire after CACHE_TTL_SECONDS)
+        self._preset_cache = TTLCache(maxsize=256, ttl=CACHE_TTL_SECONDS)  # Cache for preset data
+        self._thumbnail_cache = TTLCache(maxsize=2048, ttl=CACHE_TTL_SECONDS)  # Cache for thumbnail paths/data
+        self._ui_state_cache = TTLCache(maxsize=16, ttl=CACHE_TTL_SECONDS)  # Cache for UI state preservation
+        # Indexed by CacheKind
+        self._caches = (self._preset_cache, self._thumbnail_cache, self._ui_state_cache)
+        self._dirty = False  # Set by any invalidation, cleared once content is fully reloaded
+        self._directory_watcher: Optional[QFileSystemWatcher] = None
+
+        # Opacity changes are applied at most once per frame
+        self._opacity_timer = QTimer(self)
+        self._opacity_timer.setSingleShot(True)
+        self._opacity_timer.setInterval(OPACITY_APPLY_INTERVAL_MS)
+        self._opacity_timer.timeout.connect(self._apply_pending_opacity)
+        self._pending_opacity: Optional[float] = None
+        self._translucent: Optional[bool] = None  # Last WA_TranslucentBackground state applied
+
+        # Coalesced background refreshes triggered by bursts of events
+        self._refresh_pending: Optional[ScheduledFuture] = None
+        self._presets_refresh_pending: Optional[ScheduledFuture] = None
+        self._directory_refresh_task: Optional[ScheduledFuture] = None  # Background scan started by show_gallery
+        self._pending_selection: Optional[str] = None  # Latest screenshot to select once that scan finishes
+
+        # Last applied value per setting key, used to skip no-op updates
+        self._applied: Dict[str, Any] = {}
+
+        # Debounced settings updates
+        self._pending_settings: Dict[str, Any] = {}  # Latest value per queued setting key
+        self._settings_flush_task: Optional[ScheduledFuture] = None
+
+        # Event loop the gallery runs on, captured in initialize()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Background work started through _spawn
+        self._task_slots = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+        self._active_tasks: Set[ScheduledFuture] = set()
+        self._running_presets: Set[str] = set()  # Presets whose run is still in flight
+
+        # Streamed response tokens, drawn into the chat in batches by _stream_timer
+        self._last_stream_prefix = ""  # Text shown by the last streaming status update
+        self._pending_stream_chunks: List[str] = []
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.setInterval(STREAM_FLUSH_INTERVAL_MS)
+        self._stream_timer.timeout.connect(self._flush_stream_chunks)
 
         # Style management
         self._style_manager: Optional[DynamicStyleManager] = None
         self._screenshot_item_style_manager: Optional[ScreenshotItemStyleManager] = None
         self._preset_item_style_manager: Optional[PresetItemStyleManager] = None
+        self._last_stylesheet: Optional[str] = None  # Stylesheet currently set on the window
 
         # Components
         self.title_bar: Optional[CustomTitleBar] = None
         self.screenshots_gallery: Optional[ScreenshotGallery] = None
         self.chat_interface: Optional[ChatInterface] = None
         self.presets_panel: Optional[PresetsPanel] = None
+        self._screenshots_refresh: Optional[Callable[[], Awaitable[None]]] = None  # Resolved in _initialize_components
+        self._screenshots_select: Optional[Callable[[str], Awaitable[None]]] = None
+        self._shown = asyncio.Event()  # Set while the window is visible
+        self._deferred_columns_built = False  # Chat and presets columns are built on first show
+        self._chat_history_stale = False  # Set when a response arrives while the gallery is hidden
+        self._selection_token: Optional[object] = None  # Replaced on every selection to retire stale loads
+        self._chat_manager: Optional[ChatHistoryManager] = None  # Reused while the chat directory is unchanged
+        # Bounded pool for chat history file I/O, so disk waits never run on the event loop
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="gallery-io")
+        # User messages waiting to be written, as screenshot id -> (screenshot metadata, [(content, timestamp)])
+        self._pending_history: Dict[str, Tuple[Any, List[Tuple[str, datetime]]]] = {}
+        self._history_flush_task: Optional[ScheduledFuture] = None
 
         # Initialize UI
         self._setup_ui()
 
     async def _subscribe_to_events(self) -> None:
         """Subscribe to EventBus events."""
-        # Subscribe to Ollama response events
-        await self.event_bus.subscribe(
-            EventTypes.OLLAMA_RESPONSE_RECEIVED,
-            self._handle_ollama_response,
-            priority=90
-        )
+        await asyncio.gather(*(
+            self.event_bus.subscribe(event_type, getattr(self, handler_name), priority=priority)
+            for event_type, handler_name, priority in _SUBSCRIPTIONS
+        ))
 
-        # Subscribe to streaming updates
-        await self.event_bus.subscribe(
-            "ollama.streaming.update",
-            self._handle_streaming_update,
-            priority=90
-        )
+    def _should_handle_ui_event(self) -> bool:
+        """Check whether UI-only events have a visible, loaded gallery to update."""
+        return self.isVisible() and self._content_loaded
 
-        # Subscribe to settings updates
-        await self.event_bus.subscribe(
-            EventTypes.SETTINGS_UPDATED,
-            self._handle_settings_updated,
-            priority=80
-        )
+    @log_errors("Error handling Ollama response")
+    def _handle_ollama_response(self, event_data) -> None:
+        """Handle Ollama response events."""
+        if not self._should_handle_ui_event():
+            # The Ollama client persists the response; reload the conversation on next show
+            self._chat_history_stale = True
+            return
 
-        # Subscribe to screenshot events
-        await self.event_bus.subscribe(
-            EventTypes.SCREENSHOT_CAPTURED,
-            self._handle_screenshot_captured,
-            priority=75
-        )
+        response = _event_value(event_data, 'response')
+        if response is not None and self.chat_interface:
+            screenshot_hash = event_data.data.get('screenshot_hash')
+            self._end_stream()  # The final message replaces the streamed preview
 
-        await self.event_bus.subscribe(
-            EventTypes.SCREENSHOT_COMPLETED,
-            self._handle_screenshot_completed,
-            priority=75
-        )
+            # Only add the response if it matches the currently selected screenshot
+            if screenshot_hash and self.gallery_state.selected_screenshot_id == screenshot_hash:
+                self.chat_interface.add_ai_message(response)
+                self.chat_interface.set_status("Response received")
 
-        # Subscribe to preset events
-        await self.event_bus.subscribe(
-            EventTypes.PRESET_CREATED,
-            self._handle_preset_created,
-            priority=70
-        )
+    @log_errors("Error handling streaming update")
+    def _handle_streaming_update(self, event_data) -> None:
+        """Handle streaming update events."""
+        if not self._should_handle_ui_event():
+            return
 
-        await self.event_bus.subscribe(
-            EventTypes.PRESET_UPDATED,
-            self._handle_preset_updated,
-            priority=70
-        )
+        content = _event_value(event_data, 'content')
+        if content is not None and self.chat_interface:
+            # Note: Streaming updates don't include screenshot_hash, so we can't filter by screenshot
+            # This is a limitation of the current streaming implementation
+            # For now, we'll show streaming updates only if a screenshot is selected
+            if self.gallery_state.selected_screenshot_id:
+                # Tokens arrive far faster than is worth redrawing; draw whatever piled up every frame or two
+                self._pending_stream_chunks.append(content)
+                if not self._stream_timer.isActive():
+                    self._stream_timer.start()
+            else:
+                logger.debug("Ignoring streaming update - no screenshot selected")
 
-        await self.event_bus.subscribe(
-            EventTypes.PRESET_DELETED,
-            self._handle_preset_deleted,
-            priority=70
-        )
+    def _flush_stream_chunks(self) -> None:
+        """Draw the streamed tokens received since the last flush into the chat."""
+        if not self._pending_stream_chunks or not self.chat_interface:
+            return
+        text = "".join(self._pending_stream_chunks)
+        self._pending_stream_chunks.clear()
+        self.chat_interface.append_streaming_text(text)
+
+        prefix = text[:50]
+        # Skip the status update when it would show the same text again
+        if prefix != self._last_stream_prefix:
+            self._last_stream_prefix = prefix
+            self.chat_interface.set_status(f"Streaming: {prefix}...")
+
+    def _end_stream(self) -> None:
+        """Drop any streamed preview once the response (or an error) arrives."""
+        self._stream_timer.stop()
+        self._pending_stream_chunks.clear()
+        self._last_stream_prefix = ""
+        if self.chat_interface:
+            self.chat_interface.discard_streaming_text()
 
-        # Subscribe to application state changes
-        await self.event_bus.subscribe(
-            EventTypes.APP_STATE_CHANGED,
-            self._handle_app_state_changed,
-            priority=60
-        )
+    @log_errors("Error handling settings update")
+    def _handle_settings_updated(self, event_data) -> None:
+        """Handle settings updated events."""
+        if not event_data.data:
+            return
 
-        # Subscribe to error events
-        await self.event_bus.subscribe(
-            EventTypes.ERROR_OCCURRED,
-            self._handle_error_occurred,
-            priority=50
-        )
+        data = event_data.data
 
-    def _handle_ollama_response(self, event_data) -> None:
-        """Handle Ollama response events."""
-        try:
-            if self.chat_interface and event_data.data and 'response' in event_data.data:
-                response = event_data.data['response']
-                screenshot_hash = event_data.data.get('screenshot_hash')
+        # Handle single setting updates
+        if 'key' in data and 'value' in data:
+            self._dispatch_setting(data['key'], data['value'])
 
-                # Only add the response if it matches the currently selected screenshot
-                if screenshot_hash and self.gallery_state.selected_screenshot_id == screenshot_hash:
-                    self.chat_interface.add_ai_message(response)
-                    self.chat_interface.set_status("Response received")
+        # Handle full settings save (if it contains all settings)
+        elif 'settings' in data:
+            settings = data['settings']
 
-        except Exception as e:
-            logger.error(f"Error handling Ollama response: {e}")
+            # Prefer gallery-specific opacity over the general window opacity
+            skipped_key = 'ui.opacity' if 'ui.gallery_opacity' in settings else None
 
-    def _handle_streaming_update(self, event_data) -> None:
-        """Handle streaming update events."""
-        try:
-            if self.chat_interface and event_data.data and 'content' in event_data.data:
-                # Note: Streaming updates don't include screenshot_hash, so we can't filter by screenshot
-                # This is a limitation of the current streaming implementation
-                # For now, we'll show streaming updates only if a screenshot is selected
-                if self.gallery_state.selected_screenshot_id:
-                    content = event_data.data['content']
-                    self.chat_interface.set_status(f"Streaming: {content[:50]}...")
-                else:
-                    logger.debug("Ignoring streaming update - no screenshot selected")
+            for key, value in settings.items():
+                if key != skipped_key:
+                    self._dispatch_setting(key, value)
 
-        except Exception as e:
-            logger.error(f"Error handling streaming update: {e}")
+    def _dispatch_setting(self, key: str, value) -> None:
+        """Route a single setting change to its handler via the dispatch table."""
+        handler = self._SETTING_HANDLERS.get(key)
+        if handler is None and key.startswith(_OPT_PREFIX):
+            # Unlisted optimization keys are still forwarded to listeners
+            handler = GalleryWindow._queue_setting_change
+        if handler is None:
+            return
 
-    def _handle_settings_updated(self, event_data) -> None:
-        """Handle settings updated events."""
-        try:
-            if not event_data.data:
-                return
+        # Skip the apply entirely when the value is already in effect
+        if self._applied.get(key, _UNSET) == value:
+            return
 
-            data = event_data.data
-
-            # Handle single setting updates
-            if 'key' in data and 'value' in data:
-                key = data['key']
-                value = data['value']
-
-                # UI Theme settings
-                if key == 'ui.theme' and value != self._current_theme:
-                    self._current_theme = value
-                    asyncio.create_task(self._apply_theme_change())
-
-                # Window opacity settings
-                elif key == 'ui.opacity':
-                    opacity = float(value)
-                    self.setWindowOpacity(opacity)
-                    self._update_translucent_background(opacity)
-
-                # Gallery-specific opacity setting
-                elif key == 'ui.gallery_opacity':
-                    opacity = float(value)
-                    self.setWindowOpacity(opacity)
-                    self._update_translucent_background(opacity)
-
-                # Font size changes
-                elif key == 'ui.font_size':
-                    asyncio.create_task(self._apply_font_size_change(int(value)))
-
-                # Window behavior settings
-                elif key == 'ui.window_always_on_top':
-                    self._apply_always_on_top_change(bool(value))
-
-                # Screenshot display settings
-                elif key == 'screenshot.thumbnail_size':
-                    asyncio.create_task(self._apply_thumbnail_size_change(value))
-
-                elif key in ['screenshot.image_format', 'screenshot.quality']:
-                    asyncio.create_task(self._handle_screenshot_display_change(key, value))
-
-                # Ollama/AI settings that affect chat interface
-                elif key in ['ollama.server_url', 'ollama.default_model',
-                           'ollama.max_retries', 'ollama.enable_streaming']:
-                    asyncio.create_task(self._handle_ollama_setting_change(key, value))
-
-                # Cache and optimization settings
-                elif key.startswith('optimization.'):
-                    asyncio.create_task(self._handle_optimization_setting_change(key, value))
-
-            # Handle full settings save (if it contains all settings)
-            elif 'settings' in data:
-                settings = data['settings']
-
-                # Check for theme changes
-                if 'ui.theme' in settings and settings['ui.theme'] != self._current_theme:
-                    self._current_theme = settings['ui.theme']
-                    asyncio.create_task(self._apply_theme_change())
-
-                # Check for opacity changes (prefer gallery-specific opacity)
-                opacity_key = 'ui.gallery_opacity' if 'ui.gallery_opacity' in settings else 'ui.opacity'
-                if opacity_key in settings:
-                    opacity = float(settings[opacity_key])
-                    self.setWindowOpacity(opacity)
-                    self._update_translucent_background(opacity)
-
-                # Check for font size changes
-                if 'ui.font_size' in settings:
-                    asyncio.create_task(self._apply_font_size_change(int(settings['ui.font_size'])))
-
-                # Check for window behavior changes
-                if 'ui.window_always_on_top' in settings:
-                    self._apply_always_on_top_change(bool(settings['ui.window_always_on_top']))
-
-                # Check for screenshot-related changes
-                screenshot_keys = ['screenshot.thumbnail_size', 'screenshot.image_format', 'screenshot.quality']
-                for key in screenshot_keys:
-                    if key in settings:
-                        asyncio.create_task(self._handle_screenshot_display_change(key, settings[key]))
-
-                # Check for Ollama setting changes
-                ollama_keys = ['ollama.server_url', 'ollama.default_model',
-                              'ollama.max_retries', 'ollama.enable_streaming']
-                for key in ollama_keys:
-                    if key in settings:
-                        asyncio.create_task(self._handle_ollama_setting_change(key, settings[key]))
-
-                # Check for optimization setting changes
-                for key, value in settings.items():
-                    if key.startswith('optimization.'):
-                        asyncio.create_task(self._handle_optimization_setting_change(key, value))
+        handler(self, key, value)
+        self._applied[key] = value
+
+    def _dispatch_theme(self, key: str, value) -> None:
+        """Queue a theme change if the theme actually differs."""
+        if value != self._current_theme:
+            self._current_theme = value
+            self._queue_restyle(key, value)
+
+    def _dispatch_opacity(self, key: str, value) -> None:
+        """Apply window opacity on the next frame, coalescing slider drags."""
+        self._pending_opacity = float(value)
+        # A queued restyle picks up the opacity itself, so both land in one repaint
+        if not self._opacity_timer.isActive() and not self._restyle_queued():
+            self._opacity_timer.start()
+
+    def _apply_pending_opacity(self) -> None:
+        """Apply the most recent opacity queued by _dispatch_opacity."""
+        if self._pending_opacity is not None:
+            self._apply_opacity(self._pending_opacity)
+            self._pending_opacity = None
+
+    def _apply_opacity(self, opacity: float) -> None:
+        """Set window opacity and translucency together, skipping the repaint if unchanged."""
+        if self._applied.get('opacity') == opacity:
+            return
+        self.setWindowOpacity(opacity)
+        self._update_translucent_background(opacity)
+        self._applied['opacity'] = opacity
+
+    def _dispatch_font_size(self, key: str, value) -> None:
+        """Queue a font size change."""
+        self._queue_restyle(key, int(value))
+
+    def _restyle_queued(self) -> bool:
+        """Check whether the next settings flush will re-apply the theme."""
+        return 'ui.theme' in self._pending_settings or 'ui.font_size' in self._pending_settings
+
+    def _queue_restyle(self, key: str, value) -> None:
+        """Queue a theme-affecting change and let it carry any opacity change still waiting."""
+        self._queue_setting_change(key, value)
+        self._opacity_timer.stop()
+
+    def _dispatch_always_on_top(self, key: str, value) -> None:
+        """Apply the always-on-top window flag immediately."""
+        self._apply_always_on_top_change(bool(value))
+
+    def _spawn(self, coro, bounded: bool = False) -> ScheduledFuture:
+        """
+        Schedule a coroutine on the gallery's event loop, even from a thread without one.
+
+        Short loads pass bounded=True to share the MAX_CONCURRENT_TASKS slots; long-lived
+        work (waits for the window, AI requests, debounced flushes) never holds a slot.
+        """
+        inner = coro
+        if bounded:
+            coro = self._bounded(coro)
 
-        except Exception as e:
-            logger.error(f"Error handling settings update: {e}")
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if self._loop is None or running_loop is self._loop:
+            future = asyncio.ensure_future(coro)
+            self._track(future)
+        else:
+            # Called off the loop thread (e.g. a cross-thread Qt signal); _active_tasks is only touched on the loop
+            future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+            self._loop.call_soon_threadsafe(self._track, future)
+
+        if bounded:
+            # Cancelled before a slot was free: close the coroutine so it is not reported as never awaited
+            future.add_done_callback(lambda _: inner.close())
+        return future
+
+    def _track(self, future: ScheduledFuture) -> None:
+        """Hold a strong reference until the future finishes so it cannot be garbage collected."""
+        self._active_tasks.add(future)
+        future.add_done_callback(self._active_tasks.discard)
+
+    async def _bounded(self, coro):
+        """Run a spawned coroutine once one of the MAX_CONCURRENT_TASKS slots is free."""
+        async with self._task_slots:
+            return await coro
+
+    def _queue_setting_change(self, key: str, value) -> None:
+        """Queue a setting change and schedule a single debounced flush."""
+        self._pending_settings[key] = value
+
+        if self._settings_flush_task is None or self._settings_flush_task.done():
+            self._settings_flush_task = self._spawn(self._flush_settings())
+
+    @log_errors("Error flushing settings updates")
+    async def _flush_settings(self, delay: float = SETTINGS_FLUSH_DELAY):
+        """Apply all queued setting changes in one pass after a short debounce window."""
+        await asyncio.sleep(delay)
+
+        # Snapshot and reset so updates arriving during the apply pass schedule a new flush
+        pending = self._pending_settings
+        self._pending_settings = {}
+        self._settings_flush_task = None
+
+        # Font size changes re-apply the theme, so one pass covers both
+        if 'ui.font_size' in pending:
+            await self._apply_font_size_change(pending['ui.font_size'])
+        elif 'ui.theme' in pending:
+            await self._apply_theme_change()
 
+        # Route the remaining keys in a single pass over the snapshot
+        optimization_changes = {}
+        for key, value in pending.items():
+            if key == 'screenshot.thumbnail_size':
+                await self._apply_thumbnail_size_change(value)
+            elif key in _SCREENSHOT_KEYS:
+                await self._handle_screenshot_display_change(key, value)
+            elif key in _OLLAMA_KEYS:
+                await self._handle_ollama_setting_change(key, value)
+            elif key.startswith(_OPT_PREFIX):
+                optimization_changes[key] = value
+
+        if optimization_changes:
+            await self._handle_optimization_batch(optimization_changes)
+
+    @log_errors("Error handling screenshot captured")
     def _handle_screenshot_captured(self, event_data) -> None:
-        """Handle screenshot captured events with cache invalidation."""
-        try:
-            # Invalidate screenshot cache since we have new content
-            self.invalidate_cache('screenshots')
-
-            # Only refresh if gallery is visible and content is already loaded
-            if self.isVisible() and self._content_loaded and self.screenshots_gallery and event_data.data:
-                # Use the new refresh method for incremental updates
-                refresh_method = getattr(self.screenshots_gallery, 'refresh_screenshots', None) or \
-                               getattr(self.screenshots_gallery, 'load_screenshots', None)
-                if refresh_method:
-                    asyncio.create_task(refresh_method())
-                logger.debug("Gallery refreshed after screenshot capture")
+        """Handle screenshot captured events by marking the gallery stale."""
+        metadata = _event_value(event_data, 'metadata')
 
-        except Exception as e:
-            logger.error(f"Error handling screenshot captured: {e}")
+        # Render the thumbnail now, so opening the gallery only reads it from the disk cache
+        full_path = metadata.get('full_path') if metadata else None
+        if full_path and self.screenshots_gallery and self.screenshots_gallery.thumbnail_loader:
+            self._spawn(self.screenshots_gallery.thumbnail_loader.prewarm(full_path), bounded=True)
+
+        # The gallery grid itself still needs to pick up the new file
+        self._mark_stale()
+
+        # Only refresh if gallery is visible and content is already loaded
+        if self.isVisible() and self._content_loaded and self.screenshots_gallery and event_data.data:
+            # A pending refresh will pick this capture up as well
+            if self._refresh_pending and not self._refresh_pending.done():
+                return
 
+            self._refresh_pending = self._spawn(self._debounced_screenshots_refresh())
+            logger.debug("Gallery refresh scheduled after screenshot capture")
+
+    @log_errors("Error handling screenshot completed")
     def _handle_screenshot_completed(self, event_data) -> None:
-        """Handle screenshot completed events with cache update."""
-        try:
-            # Additional handling for completed screenshots
-            if event_data.data and 'screenshot_id' in event_data.data:
-                screenshot_id = event_data.data['screenshot_id']
-                logger.debug(f"Screenshot completed: {screenshot_id}")
+        """Handle screenshot completed events."""
+        # Additional handling for completed screenshots
+        screenshot_id = _event_value(event_data, 'screenshot_id')
+        if screenshot_id is not None:
+            logger.debug(f"Screenshot completed: {screenshot_id}")
+
+            # Update cache with new screenshot data
+            self._spawn(self._update_cache(), bounded=True)
+
+            # Optionally auto-select the new screenshot in gallery
+            if self._screenshots_select:
+                self._spawn(self._screenshots_select(screenshot_id), bounded=True)
+
+    @log_errors("Error handling screenshot directory change")
+    def _handle_screenshot_directory_changed(self, event_data) -> None:
+        """Move the directory watcher when the screenshots directory setting changes."""
+        new_path = _event_value(event_data, 'new_path')
+        if new_path:
+            self._watch_screenshot_directory(new_path)
+            self._mark_stale()
+
+    def _watch_screenshot_directory(self, directory: str) -> None:
+        """Point the file system watcher at the given screenshots directory."""
+        if self._directory_watcher is None:
+            self._directory_watcher = QFileSystemWatcher(self)
+            self._directory_watcher.directoryChanged.connect(self._on_screenshot_directory_changed)
+
+        watched = self._directory_watcher.directories()
+        if watched:
+            self._directory_watcher.removePaths(watched)
+        if directory and not self._directory_watcher.addPath(directory):
+            logger.warning(f"Could not watch screenshots directory: {directory}")
+
+    def _on_screenshot_directory_changed(self, path: str) -> None:
+        """Mark the gallery stale when screenshot files change on disk."""
+        self._mark_stale()
+
+    @log_errors("Error handling preset created")
+    def _handle_preset_created(self, event_data) -> None:
+        """Handle preset created events with cache invalidation."""
+        # Invalidate preset cache
+        self.invalidate_cache(CacheKind.PRESETS)
 
-                # Update cache with new screenshot data
-                asyncio.create_task(self._update_cache())
+        # Only refresh if gallery is visible and content is loaded
+        if self.isVisible() and self._content_loaded and self.presets_panel:
+            # Refresh in the background so the EventBus is not blocked
+            self._schedule_presets_refresh()
+            logger.debug("Presets panel refresh scheduled after preset creation")
 
-                # Optionally auto-select the new screenshot in gallery
-                if self.screenshots_gallery:
-                    select_method = getattr(self.screenshots_gallery, 'select_screenshot', None)
-                    if select_method:
-                        asyncio.create_task(select_method(screenshot_id))
+    @log_errors("Error handling preset updated")
+    def _handle_preset_updated(self, event_data) -> None:
+        """Handle preset updated events with cache invalidation."""
+        # Invalidate preset cache
+        self.invalidate_cache(CacheKind.PRESETS)
 
-        except Exception as e:
-            logger.error(f"Error handling screenshot completed: {e}")
+        # Only refresh if gallery is visible and content is loaded
+        if self.isVisible() and self._content_loaded and self.presets_panel:
+            # Refresh in the background so the EventBus is not blocked
+            self._schedule_presets_refresh()
+            logger.debug("Presets panel refresh scheduled after preset update")
 
-    async def _handle_preset_created(self, event_data) -> None:
-        """Handle preset created events with cache invalidation."""
-        try:
-            # Invalidate preset cache
-            self.invalidate_cache('presets')
+    @log_errors("Error handling preset deleted")
+    def _handle_preset_deleted(self, event_data) -> None:
+        """Handle preset deleted events with cache invalidation."""
+        # Invalidate preset cache
+        self.invalidate_cache(CacheKind.PRESETS)
 
-            # Only refresh if gallery is visible and content is loaded
-            if self.isVisible() and self._content_loaded and self.presets_panel:
-                await self.presets_panel.refresh_presets()
-                logger.debug("Presets panel refreshed after preset creation")
+        # Only refresh if gallery is visible and content is loaded
+        if self.isVisible() and self._content_loaded and self.presets_panel:
+            # Refresh in the background so the EventBus is not blocked
+            self._schedule_presets_refresh()
+            logger.debug("Presets panel refresh scheduled after preset deletion")
 
-        except Exception as e:
-            logger.error(f"Error handling preset created: {e}")
+    @log_errors("Error refreshing gallery after screenshot capture")
+    async def _debounced_screenshots_refresh(self):
+        """Refresh the screenshots column once after a burst of capture events."""
+        await asyncio.sleep(REFRESH_DEBOUNCE_DELAY)
 
-    async def _handle_preset_updated(self, event_data) -> None:
-        """Handle preset updated events with cache invalidation."""
-        try:
-            # Invalidate preset cache
-            self.invalidate_cache('presets')
+        # Captures arriving from here on schedule a new refresh
+        self._refresh_pending = None
 
-            # Only refresh if gallery is visible and content is loaded
-            if self.isVisible() and self._content_loaded and self.presets_panel:
-                await self.presets_panel.refresh_presets()
-                logger.debug("Presets panel refreshed after preset update")
+        if self._screenshots_refresh:
+            await self._screenshots_refresh()
+            logger.debug("Gallery refreshed after screenshot capture")
 
-        except Exception as e:
-            logger.error(f"Error handling preset updated: {e}")
+    def _schedule_presets_refresh(self) -> ScheduledFuture:
+        """Return the pending presets refresh, scheduling one if none is pending."""
+        if self._presets_refresh_pending is None or self._presets_refresh_pending.done():
+            self._presets_refresh_pending = self._spawn(self._debounced_presets_refresh())
+        return self._presets_refresh_pending
 
-    async def _handle_preset_deleted(self, event_data) -> None:
-        """Handle preset deleted events with cache invalidation."""
-        try:
-            # Invalidate preset cache
-            self.invalidate_cache('presets')
+    @log_errors("Error refreshing presets panel")
+    async def _debounced_presets_refresh(self):
+        """Refresh the presets column once after a burst of preset events."""
+        await asyncio.sleep(REFRESH_DEBOUNCE_DELAY)
 
-            # Only refresh if gallery is visible and content is loaded
-            if self.isVisible() and self._content_loaded and self.presets_panel:
-                await self.presets_panel.refresh_presets()
-                logger.debug("Presets panel refreshed after preset deletion")
+        # Preset events arriving from here on schedule a new refresh
+        self._presets_refresh_pending = None
 
-        except Exception as e:
-            logger.error(f"Error handling preset deleted: {e}")
+        if self.presets_panel:
+            await self.presets_panel.refresh_presets()
 
+    @log_errors("Error handling app state change")
     def _handle_app_state_changed(self, event_data) -> None:
         """Handle application state change events."""
-        try:
-            if event_data.data and 'state' in event_data.data:
-                state = event_data.data['state']
-
-                # Update gallery UI based on app state
-                if state == 'busy':
-                    # Show busy indicator in gallery
-                    if self.chat_interface:
-                        self.chat_interface.set_status("Application busy...")
-                elif state == 'ready':
-                    # Clear busy indicator
-                    if self.chat_interface:
-                        self.chat_interface.set_status("Ready")
-                elif state == 'error':
-                    # Show error state
-                    if self.chat_interface:
-                        self.chat_interface.set_status("Application error occurred")
-
-                logger.info(f"Gallery updated for app state: {state}")
+        if not self._should_handle_ui_event():
+            return
 
-        except Exception as e:
-            logger.error(f"Error handling app state change: {e}")
+        state = _event_value(event_data, 'state')
+        if state is not None:
+
+            # Update gallery UI based on app state
+            if state == 'busy':
+                # Show busy indicator in gallery
+                if self.chat_interface:
+                    self.chat_interface.set_status("Application busy...")
+            elif state == 'ready':
+                # Clear busy indicator
+                if self.chat_interface:
+                    self.chat_interface.set_status("Ready")
+            elif state == 'error':
+                # Show error state
+                if self.chat_interface:
+                    self.chat_interface.set_status("Application error occurred")
+
+            logger.info(f"Gallery updated for app state: {state}")
 
+    @log_errors("Error handling error event")
     def _handle_error_occurred(self, event_data) -> None:
         """Handle error events."""
-        try:
-            if event_data.data:
-                error_info = event_data.data
-                error_message = error_info.get('message', 'Unknown error')
+        if not self._should_handle_ui_event():
+            return
 
-                # Show error in chat interface
-                if self.chat_interface:
-                    self.chat_interface.add_system_message(f"Error: {error_message}")
+        if event_data.data:
+            error_info = event_data.data
+            error_message = error_info.get('message', 'Unknown error')
+            self._end_stream()
 
-                    # Set status to "Timeout" if it's a timeout error
-                    if 'timed out' in error_message.lower():
-                        self.chat_interface.set_status("Timeout")
+            # Show error in chat interface
+            if self.chat_interface:
+                self.chat_interface.add_system_message(f"Error: {error_message}")
 
-                logger.warning(f"Gallery received error event: {error_message}")
+                # Set status to "Timeout" if it's a timeout error
+                if 'timed out' in error_message.lower():
+                    self.chat_interface.set_status("Timeout")
 
-        except Exception as e:
-            logger.error(f"Error handling error event: {e}")
+            logger.warning(f"Gallery received error event: {error_message}")
 
+    @log_errors("Error applying theme change")
     async def _apply_theme_change(self):
         """Apply theme changes to all components."""
-        try:
-            # Reload style managers
-            await self._initialize_style_managers()
+        # Reload style managers and pass the new ones to the components
+        await self._initialize_style_managers()
+        self._apply_style_managers()
 
-            # Apply theme to all components
+        # Restyle and apply any opacity queued alongside the theme without repainting in between
+        self.setUpdatesEnabled(False)
+        try:
             self._apply_theme()
+            self._apply_pending_opacity()
+        finally:
+            self.setUpdatesEnabled(True)
 
-            logger.info(f"Theme changed to: {self._current_theme}")
-
-        except Exception as e:
-            logger.error(f"Error applying theme change: {e}")
+        logger.info(f"Theme changed to: {self._current_theme}")
 
+    @log_errors("Error applying font size change")
     async def _apply_font_size_change(self, font_size: int):
         """Apply font size changes to all components."""
-        try:
-            # Re-apply theme with new font size (this will update all styling)
-            await self._apply_theme_change()
-
-            # Emit event for components that might want to handle font size changes
-            await self.event_bus.emit(
-                "gallery.font_size_changed",
-                {
-                    "font_size": font_size,
-                    "gallery_id": id(self)
-                },
-                source="GalleryWindow"
-            )
-
-            logger.info(f"Font size changed to: {font_size}")
+        # Re-apply theme with new font size (this will update all styling)
+        await self._apply_theme_change()
+
+        # Emit event for components that might want to handle font size changes
+        await self.event_bus.emit(
+            "gallery.font_size_changed",
+            {
+                "font_size": font_size,
+                "gallery_id": id(self)
+            },
+            source="GalleryWindow"
+        )
 
-        except Exception as e:
-            logger.error(f"Error applying font size change: {e}")
+        logger.info(f"Font size changed to: {font_size}")
 
+    @log_errors("Error applying always on top change")
     def _apply_always_on_top_change(self, always_on_top: bool):
         """Apply window always-on-top setting change."""
-        try:
-            flags = self.windowFlags()
+        flags = self.windowFlags()
 
-            if always_on_top:
-                flags |= Qt.WindowType.WindowStaysOnTopHint
-            else:
-                flags &= ~Qt.WindowType.WindowStaysOnTopHint
-
-            self.setWindowFlags(flags)
+        if always_on_top:
+            flags |= Qt.WindowType.WindowStaysOnTopHint
+        else:
+            flags &= ~Qt.WindowType.WindowStaysOnTopHint
 
-            # Show window again as setWindowFlags hides it
-            if self.isVisible():
-                self.show()
+        self.setWindowFlags(flags)
 
-            logger.info(f"Always on top changed to: {always_on_top}")
+        # Show window again as setWindowFlags hides it
+        if self.isVisible():
+            self.show()
 
-        except Exception as e:
-            logger.error(f"Error applying always on top change: {e}")
+        logger.info(f"Always on top changed to: {always_on_top}")
 
+    @log_errors("Error applying thumbnail size change")
     async def _apply_thumbnail_size_change(self, thumbnail_size):
         """Apply thumbnail size changes."""
-        try:
-            # Emit event for screenshots gallery to handle
-            await self.event_bus.emit(
-                "gallery.thumbnail_size_changed",
-                {
-                    "thumbnail_size": thumbnail_size,
-                    "gallery_id": id(self)
-                },
-                source="GalleryWindow"
-            )
-
-            # Components should listen for the event emitted above
+        # Emit event for screenshots gallery to handle
+        await self.event_bus.emit(
+            "gallery.thumbnail_size_changed",
+            {
+                "thumbnail_size": thumbnail_size,
+                "gallery_id": id(self)
+            },
+            source="GalleryWindow"
+        )
 
-            logger.info(f"Thumbnail size changed to: {thumbnail_size}")
+        # Components should listen for the event emitted above
 
-        except Exception as e:
-            logger.error(f"Error applying thumbnail size change: {e}")
+        logger.info(f"Thumbnail size changed to: {thumbnail_size}")
 
+    @log_errors("Error handling screenshot display change ({key})")
     async def _handle_screenshot_display_change(self, key: str, value):
         """Handle screenshot display setting changes."""
-        try:
-            # Emit event for screenshots gallery to handle
-            await self.event_bus.emit(
-                "gallery.screenshot_display_changed",
-                {
-                    "setting_key": key,
-                    "setting_value": value,
-                    "gallery_id": id(self)
-                },
-                source="GalleryWindow"
-            )
-
-            # Components should listen for the event emitted above
-            logger.info(f"Screenshot display setting updated: {key} = {value}")
+        # Emit event for screenshots gallery to handle
+        await self.event_bus.emit(
+            "gallery.screenshot_display_changed",
+            {
+                "setting_key": key,
+                "setting_value": value,
+                "gallery_id": id(self)
+            },
+            source="GalleryWindow"
+        )
 
-        except Exception as e:
-            logger.error(f"Error handling screenshot display change ({key}): {e}")
+        # Components should listen for the event emitted above
+        logger.info(f"Screenshot display setting updated: {key} = {value}")
 
+    @log_errors("Error handling Ollama setting change ({key})")
     async def _handle_ollama_setting_change(self, key: str, value):
         """Handle Ollama/AI setting changes that affect chat interface."""
-        try:
-            # Emit event for chat interface to handle
-            await self.event_bus.emit(
-                "gallery.ollama_setting_changed",
-                {
-                    "setting_key": key,
-                    "setting_value": value,
-                    "gallery_id": id(self)
-                },
-                source="GalleryWindow"
-            )
-
-            # Components should listen for the event emitted above
-            logger.info(f"Ollama setting updated: {key} = {value}")
+        # Emit event for chat interface to handle
+        await self.event_bus.emit(
+            "gallery.ollama_setting_changed",
+            {
+                "setting_key": key,
+                "setting_value": value,
+                "gallery_id": id(self)
+            },
+            source="GalleryWindow"
+        )
 
-        except Exception as e:
-            logger.error(f"Error handling Ollama setting change ({key}): {e}")
+        # Components should listen for the event emitted above
+        logger.info(f"Ollama setting updated: {key} = {value}")
 
+    @log_errors("Error handling optimization setting change ({key})")
     async def _handle_optimization_setting_change(self, key: str, value):
         """Handle optimization setting changes."""
-        try:
-            logger.debug(f"Handling optimization setting change: {key} = {value}")
-
-            # Handle specific optimization settings
-            if key == "optimization.thumbnail_cache_enabled":
-                await self._handle_thumbnail_cache_enabled_change(bool(value))
-            elif key == "optimization.thumbnail_cache_size":
-                await self._handle_thumbnail_cache_size_change(int(value))
-            elif key == "optimization.thumbnail_quality":
-                await self._handle_thumbnail_quality_change(int(value))
-            elif key == "optimization.storage_management_enabled":
-                await self._handle_storage_management_change(bool(value))
-            elif key == "optimization.max_storage_gb":
-                await self._handle_storage_limit_change(float(value))
-            elif key == "optimization.max_file_count":
-                await self._handle_file_count_limit_change(int(value))
-            elif key == "optimization.auto_cleanup_enabled":
-                await self._handle_auto_cleanup_change(bool(value))
-            elif key == "optimization.request_pooling_enabled":
-                await self._handle_request_pooling_change(bool(value))
-            elif key == "optimization.max_concurrent_requests":
-                await self._handle_max_concurrent_change(int(value))
-            elif key == "optimization.request_timeout":
-                await self._handle_request_timeout_change(float(value))
-
-            # Emit event for other components that might need it
-            await self.event_bus.emit(
-                "gallery.optimization_setting_changed",
-                {
-                    "setting_key": key,
-                    "setting_value": value,
-                    "gallery_id": id(self)
-                },
-                source="GalleryWindow"
-            )
+        logger.debug(f"Handling optimization setting change: {key} = {value}")
+
+        # Handle specific optimization settings
+        entry = self._OPTIMIZATION_HANDLERS.get(key)
+        if entry:
+            handler, convert = entry
+            await handler(self, convert(value))
+
+        # Emit event for other components that might need it
+        await self.event_bus.emit(
+            "gallery.optimization_setting_changed",
+            {
+                "setting_key": key,
+                "setting_value": value,
+                "gallery_id": id(self)
+            },
+            source="GalleryWindow"
+        )
 
-            logger.debug(f"Optimization setting updated: {key} = {value}")
+        logger.debug(f"Optimization setting updated: {key} = {value}")
 
-        except Exception as e:
-            logger.error(f"Error handling optimization setting change ({key}): {e}")
+    async def _handle_optimization_batch(self, changes: Dict[str, Any]):
+        """Apply a batch of optimization setting changes collected by the settings flush."""
+        for key, value in changes.items():
+            await self._handle_optimization_setting_change(key, value)
+
+        logger.debug(f"Applied {len(changes)} optimization setting changes")
 
     async def initialize(self) -> bool:
         """Initialize the gallery window."""
         try:
-            # Load settings
-            self._current_theme = await self.settings_manager.get_setting("ui.theme", "dark")
-
-            # Load opacity settings - prefer gallery-specific opacity over general opacity
-            opacity = await self.settings_manager.get_setting("ui.gallery_opacity", None)
-            if opacity is None:
-                opacity = await self.settings_manager.get_setting("ui.opacity", 1.0)
-            opacity = float(opacity)
+            self._loop = asyncio.get_running_loop()
 
-            # Apply window settings
-            self.setWindowOpacity(opacity)
-            self._update_translucent_background(opacity)
+            # Load settings in one round
+            self._current_theme, gallery_opacity, opacity = await asyncio.gather(
+                self.settings_manager.get_setting("ui.theme", "dark"),
+                self.settings_manager.get_setting("ui.gallery_opacity", None),
+                self.settings_manager.get_setting("ui.opacity", 1.0)
+            )
+            self._applied['ui.theme'] = self._current_theme
 
-            # Initialize style managers
-            await self._initialize_style_managers()
+            # Apply window settings - prefer gallery-specific opacity over general opacity
+            self._apply_opacity(float(gallery_opacity if gallery_opacity is not None else opacity))
 
-            # Initialize components
-            await self._initialize_components()
+            # Stylesheet loading, component setup and event subscriptions don't depend on each other
+            await asyncio.gather(
+                self._initialize_style_managers(),
+                self._initialize_components(),
+                self._subscribe_to_events()
+            )
+            self._apply_style_managers()
 
-            # Subscribe to events
-            await self._subscribe_to_events()
+            # Watch the screenshots directory for files added or removed outside the app
+            self._watch_screenshot_directory(self.screenshot_manager.current_directory)
 
             # Apply theme
             self._apply_theme()
@@ -615,22 +843,33 @@ class GalleryWindow(QWidget):
     async def _initialize_style_managers(self):
         """Initialize style managers."""
         try:
-            # Load base stylesheets
-            self._style_manager = DynamicStyleManager("gallery", self._current_theme)
-
-            self._screenshot_item_style_manager = ScreenshotItemStyleManager(
-                self._style_manager
-            )
-
-            self._preset_item_style_manager = PresetItemStyleManager(
-                self._style_manager
-            )
+            # Build managers and read stylesheets in a worker thread to keep the UI responsive
+            loop = asyncio.get_event_loop()
+            (
+                self._style_manager,
+                self._screenshot_item_style_manager,
+                self._preset_item_style_manager
+            ) = await loop.run_in_executor(None, self._build_style_managers, self._current_theme)
 
             logger.debug("Style managers initialized")
 
         except Exception as e:
             logger.error(f"Failed to initialize style managers: {e}")
 
+    @staticmethod
+    def _build_style_managers(theme: str):
+        """Create the style managers for a theme and preload the base stylesheet."""
+        style_manager = DynamicStyleManager("gallery", theme)
+
+        # Read the stylesheet files now so _apply_theme only hits the cache
+        style_manager.load_base_styles()
+
+        return (
+            style_manager,
+            ScreenshotItemStyleManager(style_manager),
+            PresetItemStyleManager(style_manager)
+        )
+
     async def _initialize_components(self):
         """Initialize all gallery components."""
         try:
@@ -638,6 +877,12 @@ class GalleryWindow(QWidget):
             if self.screenshots_gallery:
                 self.screenshots_gallery.initialize_thumbnail_loader(self.screenshot_manager)
 
+                # Resolve the gallery entry points once instead of on every event
+                # (prefer the incremental refresh over a full reload)
+                self._screenshots_refresh = getattr(self.screenshots_gallery, 'refresh_screenshots', None) or \
+                    getattr(self.screenshots_gallery, 'load_screenshots', None)
+                self._screenshots_select = getattr(self.screenshots_gallery, 'select_screenshot', None)
+
                 # Load and apply optimization settings to thumbnail loader
                 if self.settings_manager:
                     try:
@@ -653,31 +898,38 @@ class GalleryWindow(QWidget):
                             self.screenshots_gallery.thumbnail_loader.set_cache_enabled(thumbnail_cache_enabled)
                             self.screenshots_gallery.thumbnail_loader.set_cache_size(thumbnail_cache_size)
                             self.screenshots_gallery.thumbnail_loader.set_quality(thumbnail_quality)
+                            self.screenshots_gallery.update_preload_count(optimization.preload_count)
 
                             logger.debug(f"Applied thumbnail settings: cache={thumbnail_cache_enabled}, size={thumbnail_cache_size}, quality={thumbnail_quality}")
                     except Exception as e:
                         logger.warning(f"Failed to load optimization settings: {e}")
 
-                # Set style manager
-                if self._screenshot_item_style_manager:
-                    self.screenshots_gallery.set_style_manager(self._screenshot_item_style_manager)
-
-            # Set style manager for presets panel
-            if self.presets_panel and self._preset_item_style_manager:
-                self.presets_panel.set_style_manager(self._preset_item_style_manager)
-
             logger.debug("Components initialized")
 
         except Exception as e:
             logger.error(f"Failed to initialize components: {e}")
 
+    def _apply_style_managers(self):
+        """Hand the current item style managers to the components."""
+        if self.screenshots_gallery and self._screenshot_item_style_manager:
+            self.screenshots_gallery.set_style_manager(self._screenshot_item_style_manager)
+
+        if self.presets_panel and self._preset_item_style_manager:
+            self.presets_panel.set_style_manager(self._preset_item_style_manager)
+
+    @classmethod
+    def _app_icon(cls) -> Optional[QIcon]:
+        """Return the application icon, loading it once per process."""
+        if cls._cached_app_icon is None:
+            cls._cached_app_icon = get_icon_manager().get_app_icon()
+        return cls._cached_app_icon
+
     def _setup_ui(self):
         """Setup the user interface."""
         self.setWindowTitle("ExplainShot Gallery")
 
         # Set window icon
-        icon_manager = get_icon_manager()
-        app_icon = icon_manager.get_app_icon()
+        app_icon = self._app_icon()
         if app_icon:
             self.setWindowIcon(app_icon)
 
@@ -696,36 +948,17 @@ class GalleryWindow(QWidget):
         self.title_bar = CustomTitleBar("ExplainShot Gallery", self)
         main_layout.addWidget(self.title_bar)
 
-        # Three-column splitter
-        splitter = QSplitter(Qt.Orientation.Horizontal)
-        splitter.setSizes([400, 400, 400])  # Equal width columns
-
         # Left column - Screenshots
         self.screenshots_gallery = ScreenshotGallery(self.screenshot_manager, self)
-        screenshots_frame = QFrame()
-        screenshots_frame.setObjectName("screenshots_frame")
-        screenshots_layout = QVBoxLayout(screenshots_frame)
-        screenshots_layout.setContentsMargins(0, 0, 0, 0)
-        screenshots_layout.addWidget(self.screenshots_gallery)
-        splitter.addWidget(screenshots_frame)
-
-        # Middle column - Chat
-        self.chat_interface = ChatInterface(self)
-        chat_frame = QFrame()
-        chat_frame.setObjectName("chat_frame")
-        chat_layout = QVBoxLayout(chat_frame)
-        chat_layout.setContentsMargins(0, 0, 0, 0)
-        chat_layout.addWidget(self.chat_interface)
-        splitter.addWidget(chat_frame)
 
-        # Right column - Presets
-        self.presets_panel = PresetsPanel(self.preset_manager, self)
-        presets_frame = QFrame()
-        presets_frame.setObjectName("presets_frame")
-        presets_layout = QVBoxLayout(presets_frame)
-        presets_layout.setContentsMargins(0, 0, 0, 0)
-        presets_layout.addWidget(self.presets_panel)
-        splitter.addWidget(presets_frame)
+        # Three-column splitter holding the components directly. The chat and presets
+        # columns are built after the first show and swapped in for empty placeholders
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        splitter.setChildrenCollapsible(False)
+        for column in (self.screenshots_gallery, QWidget(), QWidget()):
+            splitter.addWidget(column)
+        splitter.setSizes([400, 400, 400])  # Equal width columns
+        self._splitter = splitter
 
         main_layout.addWidget(splitter)
 
@@ -737,16 +970,49 @@ class GalleryWindow(QWidget):
         # Screenshots gallery signals
         if self.screenshots_gallery:
             self.screenshots_gallery.screenshot_selected.connect(self._on_screenshot_selected)
+            # Re-emit for outside listeners signal-to-signal, after the slot above has run
+            self.screenshots_gallery.screenshot_selected.connect(self.screenshot_selected)
             self.screenshots_gallery.screenshot_deselected.connect(self._on_screenshot_deselected)
 
-        # Chat interface signals
-        if self.chat_interface:
-            self.chat_interface.message_sent.connect(self._on_chat_message_sent)
+    def _build_deferred_columns(self):
+        """Build the chat and presets columns into their placeholder frames (idempotent)."""
+        if self._deferred_columns_built:
+            return
+        self._deferred_columns_built = True
 
-        # Presets panel signals
-        if self.presets_panel:
-            self.presets_panel.preset_run_clicked.connect(self._on_preset_run)
-            self.presets_panel.preset_paste_clicked.connect(self._on_preset_paste)
+        # Middle column - Chat
+        self.chat_interface = ChatInterface(self)
+        self._splitter.replaceWidget(1, self.chat_interface).deleteLater()
+        self.chat_interface.message_sent.connect(self._on_chat_message_sent)
+
+        # Right column - Presets
+        self.presets_panel = PresetsPanel(self.preset_manager, self)
+        self._splitter.replaceWidget(2, self.presets_panel).deleteLater()
+        self.presets_panel.preset_run_clicked.connect(self._on_preset_run)
+        self.presets_panel.preset_paste_clicked.connect(self._on_preset_paste)
+
+        if self._preset_item_style_manager:
+            self.presets_panel.set_style_manager(self._preset_item_style_manager)
+
+        # Presets were skipped by the initial content load, fetch them now
+        if self._content_loaded:
+            self._spawn(self.presets_panel.refresh_presets(), bounded=True)
+
+        logger.debug("Deferred gallery columns built")
+
+    def showEvent(self, a0):
+        """Build the deferred columns right after the window is first shown."""
+        super().showEvent(a0)
+        self._shown.set()
+        if not self._deferred_columns_built:
+            QTimer.singleShot(0, self._build_deferred_columns)
+
+        # Pick up responses that arrived while the gallery was hidden
+        screenshot_id = self.gallery_state.selected_screenshot_id
+        if self._chat_history_stale and screenshot_id and self.chat_interface:
+            self._chat_history_stale = False
+            self.chat_interface.clear_chat()
+            self._spawn(self._load_chat_history_for_screenshot(screenshot_id, self._selection_token), bounded=True)
 
     async def show_gallery(self, pre_selected_screenshot_id: Optional[str] = None):
         """Show the gallery window with optional pre-selection."""
@@ -775,25 +1041,28 @@ class GalleryWindow(QWidget):
                     if self.screenshots_gallery:
                         await self.screenshots_gallery.select_screenshot(pre_selected_screenshot_id)
 
-                # Always do a background refresh with selection to catch any new files
-                # This ensures we don't miss recently created screenshots
-                asyncio.create_task(self._refresh_screenshots_directory_async(pre_selected_screenshot_id))
-            else:
-                # Just do a standard refresh without selection
-                asyncio.create_task(self._refresh_screenshots_directory_async())
+                # The background refresh selects it again once new files are picked up
+                self._pending_selection = pre_selected_screenshot_id
+
+            # Always do a background refresh to catch any new files, reusing one already in flight
+            if self._directory_refresh_task is None or self._directory_refresh_task.done():
+                self._directory_refresh_task = self._spawn(self._refresh_screenshots_directory_async())
 
             logger.debug("Gallery window shown")
 
         except Exception as e:
             logger.error(f"Error showing gallery: {e}")
 
-    async def _refresh_screenshots_directory_async(self, pre_selected_screenshot_id: Optional[str] = None):
+    async def _refresh_screenshots_directory_async(self):
         """Asynchronously refresh the screenshots directory to catch any new files."""
         try:
-            # Small delay to let the UI settle after showing
-            await asyncio.sleep(0.1)
+            while True:
+                # Run once the window is shown rather than after a fixed delay
+                await self._shown.wait()
+
+                if not (self.screenshots_gallery and self.screenshot_manager):
+                    return
 
-            if self.screenshots_gallery and self.screenshot_manager:
                 # Force a fresh scan of the screenshot directory to catch potential new files
                 logger.debug("Triggering background screenshot directory refresh with force scan")
 
@@ -808,6 +1077,8 @@ class GalleryWindow(QWidget):
                 # Try to select the pre-selected screenshot after refresh
                 # This is crucial for cases where the gallery was hidden and a new screenshot
                 # was captured - the initial selection might fail if the screenshot wasn't loaded yet
+                pre_selected_screenshot_id = self._pending_selection
+                self._pending_selection = None
                 if pre_selected_screenshot_id and self.screenshots_gallery:
                     logger.debug(f"Attempting to select screenshot after refresh: {pre_selected_screenshot_id[:8]}")
                     await self.screenshots_gallery.select_screenshot(pre_selected_screenshot_id)
@@ -817,6 +1088,10 @@ class GalleryWindow(QWidget):
 
                 logger.debug("Background screenshot directory refresh completed")
 
+                # Scan again only if another show requested a selection while this one ran
+                if self._pending_selection is None:
+                    return
+
         except Exception as e:
             logger.error(f"Error during background screenshot directory refresh: {e}")
 
@@ -830,6 +1105,8 @@ class GalleryWindow(QWidget):
             else:
                 logger.debug("Cache expired or invalid, reloading content")
                 await self._load_fresh_content()
+                # Only a full reload makes the cache valid again; the snapshot below alone does not
+                self._dirty = False
                 await self._update_cache()
 
         except Exception as e:
@@ -839,12 +1116,9 @@ class GalleryWindow(QWidget):
 
     def _is_cache_valid(self) -> bool:
         """Check if the current cache is still valid."""
-        if not self._cache_timestamp:
-            return False
-
-        import time
-        current_time = time.time()
-        return (current_time - self._cache_timestamp) < self._cache_expiry_seconds
+        # Nothing has been invalidated since the last update, and the UI state
+        # snapshot written by that update has not hit the safety-net TTL
+        return not self._dirty and bool(self._ui_state_cache)
 
     async def _restore_from_cache(self):
         """Restore gallery content from cache."""
@@ -854,13 +1128,10 @@ class GalleryWindow(QWidget):
                 logger.debug("Content already loaded and cache valid, skipping reload")
                 return
 
-            # Load screenshots only if not already loaded
-            if self.screenshots_gallery and not self.screenshots_gallery.screenshot_items:
-                await self.screenshots_gallery.load_screenshots()
-
-            # Load presets only if not already loaded
-            if self.presets_panel:
-                await self.presets_panel.refresh_presets()
+            # Load screenshots only if not already loaded, alongside the presets
+            await self._load_columns(
+                load_screenshots=bool(self.screenshots_gallery and not self.screenshots_gallery.screenshot_items)
+            )
 
             # Restore UI state
             if self._ui_state_cache:
@@ -876,53 +1147,40 @@ class GalleryWindow(QWidget):
     async def _load_fresh_content(self):
         """Load fresh content from data sources."""
         try:
-            # Load screenshots
-            if self.screenshots_gallery:
-                await self.screenshots_gallery.load_screenshots()
-
-            # Load presets
-            if self.presets_panel:
-                await self.presets_panel.refresh_presets()
+            await self._load_columns()
 
             logger.debug("Fresh gallery content loaded")
 
         except Exception as e:
             logger.error(f"Error loading fresh gallery content: {e}")
 
+    async def _load_columns(self, load_screenshots: bool = True):
+        """Load screenshots and presets concurrently; they read from independent sources."""
+        loads = {}
+        if load_screenshots and self.screenshots_gallery:
+            loads['screenshots'] = self.screenshots_gallery.load_screenshots()
+        if self.presets_panel:
+            # Refresh from disk to catch manually added preset files
+            loads['presets'] = self.presets_panel.refresh_presets()
+
+        results = await asyncio.gather(*loads.values(), return_exceptions=True)
+        for name, result in zip(loads, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error loading gallery {name}: {result}")
+
     async def _update_cache(self):
         """Update the cache with current data."""
         try:
-            import time
+            # Screenshot metadata is looked up through ScreenshotManager's index; preset data
+            # is cached on demand by _get_preset_by_id
 
-            # Cache screenshot metadata
-            if self.screenshots_gallery:
-                screenshots = await self.screenshot_manager.get_recent_screenshots(limit=50)
-                self._screenshot_cache = {
-                    'screenshots': [
-                        {
-                            'hash': s.hash or s.unique_id,
-                            'filename': s.filename,
-                            'timestamp': s.timestamp,
-                            'full_path': s.full_path
-                        }
-                        for s in screenshots if s.hash or s.unique_id
-                    ]
-                }
-
-            # Cache preset data
-            if self.presets_panel:
-                # We don't have direct access to preset list, so we'll cache later when events update
-                pass
-
-            # Cache UI state
-            self._ui_state_cache = {
+            # Cache UI state (geometry as plain ints, not a Qt value object)
+            geometry = self.geometry()
+            self._ui_state_cache.update({
                 'selected_screenshot_id': self.gallery_state.selected_screenshot_id,
-                'window_geometry': self.geometry(),
+                'window_geometry': (geometry.x(), geometry.y(), geometry.width(), geometry.height()),
                 'splitter_sizes': None  # We'll add this if we can access splitter
-            }
-
-            # Update cache timestamp
-            self._cache_timestamp = time.time()
+            })
 
             logger.debug("Gallery cache updated")
 
@@ -938,45 +1196,35 @@ class GalleryWindow(QWidget):
 
             # Restore window geometry
             if ui_state.get('window_geometry'):
-                self.setGeometry(ui_state['window_geometry'])
+                self.setGeometry(*ui_state['window_geometry'])
 
             logger.debug("UI state restored from cache")
 
         except Exception as e:
             logger.error(f"Error restoring UI state: {e}")
 
-    def invalidate_cache(self, cache_type: Optional[str] = None):
+    def _mark_stale(self) -> None:
+        """Force the next show to reload content."""
+        self._dirty = True
+
+    def invalidate_cache(self, cache_type: Optional[CacheKind] = None):
         """Invalidate specific cache or all caches."""
-        if cache_type == 'screenshots':
-            self._screenshot_cache.clear()
-        elif cache_type == 'presets':
-            self._preset_cache.clear()
-        elif cache_type == 'thumbnails':
-            self._thumbnail_cache.clear()
-        elif cache_type == 'ui_state':
-            self._ui_state_cache.clear()
+        self._mark_stale()
+        if cache_type is not None:
+            self._caches[cache_type].clear()
         else:
             # Invalidate all caches
-            self._screenshot_cache.clear()
-            self._preset_cache.clear()
-            self._thumbnail_cache.clear()
-            self._ui_state_cache.clear()
-            self._cache_timestamp = None
+            for cache in self._caches:
+                cache.clear()
             # Reset content loaded flag when invalidating all caches
             self._content_loaded = False
 
-        logger.info(f"Cache invalidated: {cache_type or 'all'}")
+        logger.info(f"Cache invalidated: {cache_type.name.lower() if cache_type is not None else 'all'}")
 
     async def _load_content(self):
         """Load all gallery content."""
         try:
-            # Load screenshots
-            if self.screenshots_gallery:
-                await self.screenshots_gallery.load_screenshots()
-
-            # Load presets (refresh from disk first to catch manually added files)
-            if self.presets_panel:
-                await self.presets_panel.refresh_presets()
+            await self._load_columns()
 
             logger.debug("Gallery content loaded")
 
@@ -985,74 +1233,86 @@ class GalleryWindow(QWidget):
 
     def _on_screenshot_selected(self, screenshot_id: str):
         """Handle screenshot selection."""
-        # Store the selected screenshot ID
+        # The chat column must exist before its history is loaded
+        self._build_deferred_columns()
+
+        # Store the selected screenshot ID; the new token retires loads started for earlier selections
         self.gallery_state.selected_screenshot_id = screenshot_id
+        self._selection_token = token = object()
 
         # Clear chat UI immediately when switching screenshots
         if self.chat_interface:
             self.chat_interface.clear_chat()
 
-        # Get and store screenshot metadata for context, then load chat history
-        asyncio.create_task(self._load_selected_screenshot_data(screenshot_id))
+        # Get and store screenshot metadata for context while loading chat history
+        self._spawn(self._load_selected_screenshot_data(screenshot_id, token), bounded=True)
 
-        self.screenshot_selected.emit(screenshot_id)
-        logger.debug(f"Screenshot selected: {screenshot_id}")
+        logger.debug("Screenshot selected: %s", screenshot_id)
 
-    async def _load_selected_screenshot_data(self, screenshot_hash: str):
-        """Load metadata and chat history for the selected screenshot."""
+    async def _load_selected_screenshot_data(self, screenshot_hash: str, token: object):
+        """Load metadata and chat history for the selected screenshot concurrently."""
         try:
-            # Get all screenshots and find the one with matching hash
-            screenshots = await self.screenshot_manager.scan_screenshot_directory()
-            for screenshot in screenshots:
-                if screenshot.hash == screenshot_hash or screenshot.unique_id == screenshot_hash:
-                    self.gallery_state.selected_screenshot_metadata = screenshot
-                    logger.debug(f"Loaded metadata for selected screenshot: {screenshot_hash}")
-
-                    # Load chat history for this screenshot
-                    await self._load_chat_history_for_screenshot(screenshot_hash)
-                    break
+            await asyncio.gather(
+                self._load_selected_metadata(screenshot_hash, token),
+                self._load_chat_history_for_screenshot(screenshot_hash, token)
+            )
         except Exception as e:
             logger.error(f"Failed to load screenshot data for {screenshot_hash}: {e}")
 
-    async def _load_chat_history_for_screenshot(self, screenshot_hash: str):
-        """Load and display chat history for the selected screenshot."""
-        try:
-            # Import ChatHistoryManager here to avoid circular imports
-            from src.models.chat_history_manager import ChatHistoryManager
+    async def _load_selected_metadata(self, screenshot_hash: str, token: object):
+        """Store the selected screenshot's metadata for chat context."""
+        # Use the index from the last directory scan, rescanning only on a miss
+        screenshot = self.screenshot_manager.get_by_hash(screenshot_hash)
+        if screenshot is None:
+            await self.screenshot_manager.scan_screenshot_directory()
+            screenshot = self.screenshot_manager.get_by_hash(screenshot_hash)
+
+        if screenshot and self._selection_token is token:
+            self.gallery_state.selected_screenshot_metadata = screenshot
+            logger.debug("Loaded metadata for selected screenshot: %s", screenshot_hash)
+
+    async def _get_chat_manager(self) -> Optional[ChatHistoryManager]:
+        """Return the chat history manager for the configured directory, creating it on first use."""
+        # Get chat history directory from settings
+        if not self.settings_manager:
+            logger.warning("No settings manager available for chat history")
+            return None
 
-            # Get chat history directory from settings
-            if not self.settings_manager:
-                logger.warning("No settings manager available for chat history loading")
-                return
+        settings = await self.settings_manager.load_settings()
+        chat_dir = settings.chat.chat_history_directory
 
-            settings = await self.settings_manager.load_settings()
-            chat_dir = settings.chat.chat_history_directory
+        if not chat_dir:
+            logger.warning("Chat history directory not configured")
+            return None
 
-            if not chat_dir:
-                logger.warning("Chat history directory not configured")
-                return
+        # Rebuild only when the configured directory changes
+        if self._chat_manager is None or self._chat_manager.chat_directory != Path(chat_dir):
+            self._chat_manager = ChatHistoryManager(chat_dir, executor=self._io_pool)
 
-            # Create ChatHistoryManager instance
-            chat_manager = ChatHistoryManager(chat_dir)
+        return self._chat_manager
+
+    async def _load_chat_history_for_screenshot(self, screenshot_hash: str, token: Optional[object]):
+        """Load and display chat history for the selection identified by token."""
+        try:
+            chat_manager = await self._get_chat_manager()
+            if not chat_manager:
+                return
 
             # Load conversation for this screenshot
             messages = await chat_manager.load_conversation(screenshot_hash)
 
-            if messages and self.chat_interface:
-                # Check if this screenshot is still selected before displaying messages
-                # This prevents mixing chat histories when switching screenshots quickly
-                if self.gallery_state.selected_screenshot_id != screenshot_hash:
-                    logger.debug(f"Screenshot {screenshot_hash[:8]}... deselected before chat history could be displayed, skipping")
-                    return
+            # Check if this selection is still current before touching the UI
+            # This prevents mixing chat histories when switching screenshots quickly
+            if self._selection_token is not token:
+                logger.debug("Screenshot %.8s... deselected before chat history could be displayed, skipping", screenshot_hash)
+                return
 
-                # Display each message in the UI
-                for message in messages:
-                    if message.role == "user":
-                        self.chat_interface.add_user_message(message.content)
-                    elif message.role == "assistant":
-                        self.chat_interface.add_ai_message(message.content)
-                    elif message.role == "system":
-                        self.chat_interface.add_system_message(message.content)
+            if messages and self.chat_interface:
+                # Display all messages in a single render pass
+                self.chat_interface.add_messages(
+                    (_CHAT_SENDERS[message.role], message.content)
+                    for message in messages if message.role in _CHAT_SENDERS
+                )
 
                 logger.debug(f"Loaded {len(messages)} chat messages for screenshot {screenshot_hash[:8]}...")
 
@@ -1073,6 +1333,7 @@ class GalleryWindow(QWidget):
     def _on_screenshot_deselected(self):
         """Handle screenshot deselection."""
         self.gallery_state.selected_screenshot_id = None
+        self._selection_token = None
         self.gallery_state.selected_screenshot_metadata = None
 
         # Clear chat UI when no screenshot is selected
@@ -1088,13 +1349,19 @@ class GalleryWindow(QWidget):
                 self.chat_interface.add_system_message("Please select a screenshot first")
             return
 
+        # Ignore repeated presses while the same preset is still running
+        if preset_id in self._running_presets:
+            return
+        self._running_presets.add(preset_id)
+
         # Run async preset execution
-        asyncio.create_task(self._run_preset_async(preset_id))
+        run = self._spawn(self._run_preset_async(preset_id))
+        run.add_done_callback(lambda _: self._running_presets.discard(preset_id))
 
     def _on_preset_paste(self, preset_id: str):
         """Handle preset paste button clicks."""
         # Run async preset paste
-        asyncio.create_task(self._paste_preset_async(preset_id))
+        self._spawn(self._paste_preset_async(preset_id))
 
     async def _run_preset_async(self, preset_id: str):
         """Handle preset run asynchronously."""
@@ -1105,25 +1372,16 @@ class GalleryWindow(QWidget):
                 self.chat_interface.add_user_message(preset_data.prompt)
                 self.chat_interface.set_status("Processing...")
 
-                # Save user message to chat history immediately
-                asyncio.create_task(self._save_user_message_to_history(preset_data.prompt))
+                # Save user message to chat history (batched)
+                self._save_user_message_to_history(preset_data.prompt)
 
                 # Create context for the preset execution
-                context = {
-                    "selected_screenshot": self.gallery_state.selected_screenshot_id,
-                    "preset_id": preset_id,
-                    "timestamp": datetime.now().isoformat()
-                }
-
-                # Add image path if we have screenshot metadata
-                if self.gallery_state.selected_screenshot_metadata:
-                    context["image_path"] = self.gallery_state.selected_screenshot_metadata.full_path
-                    context["screenshot_metadata"] = self.gallery_state.selected_screenshot_metadata
+                context = self._selection_context(preset_id=preset_id)
 
                 # Emit preset execution event
                 self.preset_executed.emit(preset_id, context)
 
-                logger.info(f"Preset executed: {preset_id}")
+                logger.info("Preset executed: %s", preset_id)
 
         except Exception as e:
             logger.error(f"Error running preset {preset_id}: {e}")
@@ -1136,7 +1394,7 @@ class GalleryWindow(QWidget):
             preset_data = await self._get_preset_by_id(preset_id)
             if preset_data and self.chat_interface:
                 self.chat_interface.set_prompt_text(preset_data.prompt)
-                logger.info(f"Preset pasted: {preset_id}")
+                logger.info("Preset pasted: %s", preset_id)
 
         except Exception as e:
             logger.error(f"Error pasting preset {preset_id}: {e}")
@@ -1154,22 +1412,14 @@ class GalleryWindow(QWidget):
             self.chat_interface.add_user_message(message)
             self.chat_interface.set_status("Processing...")
 
-        # Save user message to chat history immediately
-        asyncio.create_task(self._save_user_message_to_history(message))
+        # Save user message to chat history (batched with any others sent right after it)
+        self._save_user_message_to_history(message)
 
         # Create context with screenshot information
-        context = {
-            "selected_screenshot": self.gallery_state.selected_screenshot_id,
-            "timestamp": datetime.now().isoformat()
-        }
-
-        # Add image path if we have screenshot metadata
-        if self.gallery_state.selected_screenshot_metadata:
-            context["image_path"] = self.gallery_state.selected_screenshot_metadata.full_path
-            context["screenshot_metadata"] = self.gallery_state.selected_screenshot_metadata
+        context = self._selection_context()
 
         # Emit chat event through EventBus
-        asyncio.create_task(
+        self._spawn(
             self.event_bus.emit(
                 EventTypes.GALLERY_CHAT_MESSAGE_SENT,
                 {
@@ -1180,59 +1430,86 @@ class GalleryWindow(QWidget):
             )
         )
 
-        logger.debug(f"Chat message sent: {message}")
-
-    async def _save_user_message_to_history(self, message: str):
-        """Save user message to chat history immediately."""
-        try:
-            if not self.gallery_state.selected_screenshot_id:
-                return
+        logger.debug("Chat message sent: %s", message)
 
-            from src.models.chat_history_manager import ChatHistoryManager, ChatMessage
-
-            # Get chat history directory from settings
-            if not self.settings_manager:
-                return
+    def _selection_context(self, **extra) -> Dict[str, Any]:
+        """Build the screenshot context sent with chat messages and preset runs."""
+        context = {
+            "selected_screenshot": self.gallery_state.selected_screenshot_id,
+            **extra,
+            "timestamp": time.time()  # Epoch seconds; only formatted by consumers that need it
+        }
 
-            settings = await self.settings_manager.load_settings()
-            chat_dir = settings.chat.chat_history_directory
+        # Add image path if we have screenshot metadata
+        metadata = self.gallery_state.selected_screenshot_metadata
+        if metadata:
+            context["image_path"] = metadata.full_path
+            context["screenshot_metadata"] = metadata
 
-            if not chat_dir:
-                return
+        return context
 
-            # Create ChatHistoryManager instance
-            chat_manager = ChatHistoryManager(chat_dir)
+    def _save_user_message_to_history(self, message: str):
+        """Queue a user message for the next batched chat history write."""
+        screenshot_id = self.gallery_state.selected_screenshot_id
+        if not screenshot_id:
+            return
 
-            # Load existing conversation to get next message ID
-            existing_messages = await chat_manager.load_conversation(self.gallery_state.selected_screenshot_id)
-            next_id = len(existing_messages) + 1
+        _, messages = self._pending_history.setdefault(
+            screenshot_id, (self.gallery_state.selected_screenshot_metadata, [])
+        )
+        messages.append((message, datetime.now()))
 
-            # Create user message
-            user_message = ChatMessage(
-                message_id=next_id,
-                role="user",
-                content=message,
-                timestamp=datetime.now()
-            )
+        if self._history_flush_task is None or self._history_flush_task.done():
+            self._history_flush_task = self._spawn(self._flush_history_writes())
 
-            # Save user message
-            await chat_manager.save_message(
-                self.gallery_state.selected_screenshot_id,
-                user_message,
-                self.gallery_state.selected_screenshot_metadata
-            )
+    @log_errors("Failed to save user messages to chat history")
+    async def _flush_history_writes(self, delay: float = HISTORY_FLUSH_DELAY):
+        """Write all queued user messages, one batch per conversation."""
+        await asyncio.sleep(delay)
 
-            logger.debug(f"Saved user message to chat history: {message[:50]}...")
+        chat_manager = await self._get_chat_manager()
+        if not chat_manager:
+            # Nowhere to write them
+            self._pending_history.clear()
+            return
 
-        except Exception as e:
-            logger.error(f"Failed to save user message to chat history: {e}")
+        # Messages stay queued until their write succeeds; ones sent during a write are picked
+        # up by the next pass, since this task still counts as the pending flush
+        failed: Set[str] = set()
+        while True:
+            screenshot_ids = [screenshot_id for screenshot_id in self._pending_history if screenshot_id not in failed]
+            if not screenshot_ids:
+                break
+
+            for screenshot_id in screenshot_ids:
+                screenshot_metadata, queued = self._pending_history[screenshot_id]
+                batch = queued[:]
+                next_id = await chat_manager.get_next_message_id(screenshot_id)
+                messages = [
+                    ChatHistoryMessage(message_id=next_id + offset, role="user", content=content, timestamp=timestamp)
+                    for offset, (content, timestamp) in enumerate(batch)
+                ]
+                if not await chat_manager.save_messages(screenshot_id, messages, screenshot_metadata):
+                    # Kept for the next flush
+                    failed.add(screenshot_id)
+                    continue
+
+                del queued[:len(batch)]
+                if not queued:
+                    del self._pending_history[screenshot_id]
+                logger.debug(f"Saved {len(messages)} user message(s) to chat history for {screenshot_id[:8]}...")
 
     async def _get_preset_by_id(self, preset_id: str) -> Optional[PresetData]:
-        """Get preset data by ID."""
+        """Get preset data by ID, served from the preset cache when possible."""
         try:
+            # Preset create/update/delete events invalidate the whole preset cache
+            cached = self._preset_cache.get(preset_id)
+            if cached is not None:
+                return cached
+
             preset = await self.preset_manager.get_preset_by_id(preset_id)
             if preset:
-                return PresetData(
+                preset_data = PresetData(
                     id=preset_id,
                     name=preset.name,
                     prompt=preset.prompt,
@@ -1240,6 +1517,8 @@ class GalleryWindow(QWidget):
                     usage_count=preset.usage_count,
                     created_at=preset.created_at
                 )
+                self._preset_cache[preset_id] = preset_data
+                return preset_data
             return None
 
         except Exception as e:
@@ -1248,115 +1527,136 @@ class GalleryWindow(QWidget):
 
     def _update_translucent_background(self, opacity: float):
         """Update the WA_TranslucentBackground attribute based on opacity."""
-        if opacity >= 1.0:
-            if self.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground):
-                self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
-        else:
-            if not self.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground):
-                self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        translucent = opacity < 1.0
+        if translucent == self._translucent:
+            return
+        if self.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground) != translucent:
+            self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, translucent)
+        self._translucent = translucent
 
     def _apply_theme(self):
         """Apply theme styling."""
         if self._style_manager:
+            # The style manager owns the combined sheet; the files behind it are read once per process
             stylesheet = self._style_manager.load_base_styles()
-            if stylesheet:
+
+            # Re-setting an identical stylesheet still makes Qt re-polish the whole widget tree
+            if stylesheet and stylesheet != self._last_stylesheet:
                 self.setStyleSheet(stylesheet)
+                self._last_stylesheet = stylesheet
                 logger.debug("Theme applied to gallery window")
         else:
             logger.warning("No style manager available for theme application")
 
     # Optimization setting handlers
+    @log_errors("Error handling thumbnail cache enabled change")
     async def _handle_thumbnail_cache_enabled_change(self, enabled: bool):
         """Handle thumbnail cache enabled setting change."""
-        try:
-            if hasattr(self, 'screenshots_gallery') and self.screenshots_gallery:
-                # Notify screenshots gallery component about cache setting change
-                await self.screenshots_gallery.update_thumbnail_cache_setting(enabled)
-            logger.debug(f"Thumbnail cache enabled changed to: {enabled}")
-        except Exception as e:
-            logger.error(f"Error handling thumbnail cache enabled change: {e}")
+        if self.screenshots_gallery is not None:
+            # Notify screenshots gallery component about cache setting change
+            await self.screenshots_gallery.update_thumbnail_cache_setting(enabled)
+        logger.debug(f"Thumbnail cache enabled changed to: {enabled}")
 
+    @log_errors("Error handling thumbnail cache size change")
     async def _handle_thumbnail_cache_size_change(self, size: int):
         """Handle thumbnail cache size setting change."""
-        try:
-            if hasattr(self, 'screenshots_gallery') and self.screenshots_gallery:
-                # Notify screenshots gallery component about cache size change
-                await self.screenshots_gallery.update_thumbnail_cache_size(size)
-            logger.debug(f"Thumbnail cache size changed to: {size}")
-        except Exception as e:
-            logger.error(f"Error handling thumbnail cache size change: {e}")
+        if self.screenshots_gallery is not None:
+            # Notify screenshots gallery component about cache size change
+            await self.screenshots_gallery.update_thumbnail_cache_size(size)
+        logger.debug(f"Thumbnail cache size changed to: {size}")
 
+    @log_errors("Error handling thumbnail quality change")
     async def _handle_thumbnail_quality_change(self, quality: int):
         """Handle thumbnail quality setting change."""
-        try:
-            if hasattr(self, 'screenshots_gallery') and self.screenshots_gallery:
-                # Notify screenshots gallery component about quality change
-                await self.screenshots_gallery.update_thumbnail_quality(quality)
-            logger.debug(f"Thumbnail quality changed to: {quality}")
-        except Exception as e:
-            logger.error(f"Error handling thumbnail quality change: {e}")
-
+        if self.screenshots_gallery is not None:
+            # Notify screenshots gallery component about quality change
+            await self.screenshots_gallery.update_thumbnail_quality(quality)
+        logger.debug(f"Thumbnail quality changed to: {quality}")
+
+    @log_errors("Error handling thumbnail preload count change")
+    async def _handle_preload_count_change(self, count: int):
+        """Handle thumbnail preload count setting change."""
+        if self.screenshots_gallery is not None:
+            self.screenshots_gallery.update_preload_count(count)
+        logger.debug(f"Thumbnail preload count changed to: {count}")
+
+    @log_errors("Error handling storage management change")
     async def _handle_storage_management_change(self, enabled: bool):
         """Handle storage management enabled setting change."""
-        try:
-            # This could trigger storage manager reconfiguration
-            logger.debug(f"Storage management enabled changed to: {enabled}")
-        except Exception as e:
-            logger.error(f"Error handling storage management change: {e}")
+        # This could trigger storage manager reconfiguration
+        logger.debug(f"Storage management enabled changed to: {enabled}")
 
+    @log_errors("Error handling storage limit change")
     async def _handle_storage_limit_change(self, limit_gb: float):
         """Handle storage limit setting change."""
-        try:
-            # This could trigger storage manager reconfiguration
-            logger.debug(f"Storage limit changed to: {limit_gb} GB")
-        except Exception as e:
-            logger.error(f"Error handling storage limit change: {e}")
+        # This could trigger storage manager reconfiguration
+        logger.debug(f"Storage limit changed to: {limit_gb} GB")
 
+    @log_errors("Error handling file count limit change")
     async def _handle_file_count_limit_change(self, limit: int):
         """Handle file count limit setting change."""
-        try:
-            # This could trigger storage manager reconfiguration
-            logger.debug(f"File count limit changed to: {limit}")
-        except Exception as e:
-            logger.error(f"Error handling file count limit change: {e}")
+        # This could trigger storage manager reconfiguration
+        logger.debug(f"File count limit changed to: {limit}")
 
+    @log_errors("Error handling auto cleanup change")
     async def _handle_auto_cleanup_change(self, enabled: bool):
         """Handle auto cleanup enabled setting change."""
-        try:
-            # This could trigger storage manager reconfiguration
-            logger.debug(f"Auto cleanup enabled changed to: {enabled}")
-        except Exception as e:
-            logger.error(f"Error handling auto cleanup change: {e}")
+        # This could trigger storage manager reconfiguration
+        logger.debug(f"Auto cleanup enabled changed to: {enabled}")
 
+    @log_errors("Error handling request pooling change")
     async def _handle_request_pooling_change(self, enabled: bool):
         """Handle request pooling enabled setting change."""
-        try:
-            if hasattr(self, 'chat_interface') and self.chat_interface:
-                # Notify chat interface about request pooling change
-                await self.chat_interface.update_request_pooling_setting(enabled)
-            logger.debug(f"Request pooling enabled changed to: {enabled}")
-        except Exception as e:
-            logger.error(f"Error handling request pooling change: {e}")
+        if self.chat_interface is not None:
+            # Notify chat interface about request pooling change
+            await self.chat_interface.update_request_pooling_setting(enabled)
+        logger.debug(f"Request pooling enabled changed to: {enabled}")
 
+    @log_errors("Error handling max concurrent change")
     async def _handle_max_concurrent_change(self, max_concurrent: int):
         """Handle max concurrent requests setting change."""
-        try:
-            if hasattr(self, 'chat_interface') and self.chat_interface:
-                # Notify chat interface about max concurrent change
-                await self.chat_interface.update_max_concurrent_setting(max_concurrent)
-            logger.debug(f"Max concurrent requests changed to: {max_concurrent}")
-        except Exception as e:
-            logger.error(f"Error handling max concurrent change: {e}")
+        if self.chat_interface is not None:
+            # Notify chat interface about max concurrent change
+            await self.chat_interface.update_max_concurrent_setting(max_concurrent)
+        logger.debug(f"Max concurrent requests changed to: {max_concurrent}")
 
+    @log_errors("Error handling request timeout change")
     async def _handle_request_timeout_change(self, timeout: float):
         """Handle request timeout setting change."""
-        try:
-            if hasattr(self, 'chat_interface') and self.chat_interface:
-                # Notify chat interface about timeout change
-                await self.chat_interface.update_request_timeout_setting(timeout)
-            logger.debug(f"Request timeout changed to: {timeout} seconds")
-        except Exception as e:
-            logger.error(f"Error handling request timeout change: {e}")
+        if self.chat_interface is not None:
+            # Notify chat interface about timeout change
+            await self.chat_interface.update_request_timeout_setting(timeout)
+        logger.debug(f"Request timeout changed to: {timeout} seconds")
+
+    # Settings dispatch tables (key -> handler), built once at class creation
+    _SETTING_HANDLERS = {
+        'ui.theme': _dispatch_theme,
+        'ui.opacity': _dispatch_opacity,
+        'ui.gallery_opacity': _dispatch_opacity,
+        'ui.font_size': _dispatch_font_size,
+        'ui.window_always_on_top': _dispatch_always_on_top,
+        **dict.fromkeys(_SCREENSHOT_KEYS | _OLLAMA_KEYS, _queue_setting_change),
+    }
+
+    _OPTIMIZATION_HANDLERS = {
+        'optimization.thumbnail_cache_enabled': (_handle_thumbnail_cache_enabled_change, bool),
+        'optimization.thumbnail_cache_size': (_handle_thumbnail_cache_size_change, int),
+        'optimization.thumbnail_quality': (_handle_thumbnail_quality_change, int),
+        'optimization.preload_count': (_handle_preload_count_change, int),
+        'optimization.storage_management_enabled': (_handle_storage_management_change, bool),
+        'optimization.max_storage_gb': (_handle_storage_limit_change, float),
+        'optimization.max_file_count': (_handle_file_count_limit_change, int),
+        'optimization.auto_cleanup_enabled': (_handle_auto_cleanup_change, bool),
+        'optimization.request_pooling_enabled': (_handle_request_pooling_change, bool),
+        'optimization.max_concurrent_requests': (_handle_max_concurrent_change, int),
+        'optimization.request_timeout': (_handle_request_timeout_change, float),
+    }
+    _SETTING_HANDLERS.update(dict.fromkeys(_OPTIMIZATION_HANDLERS, _queue_setting_change))
+
+    def hideEvent(self, a0):
+        """Pause background refreshes that wait for the window to be shown."""
+        super().hideEvent(a0)
+        self._shown.clear()
 
     def closeEvent(self, a0):
         """Handle window close event - hide instead of close to preserve state."""
@@ -1375,22 +1675,10 @@ class GalleryWindow(QWidget):
             if not a0:
                 return
 
-            from PyQt6.QtCore import Qt
-
-            # F5 or Ctrl+R for manual refresh
-            if (a0.key() == Qt.Key.Key_F5 or
-                (a0.modifiers() == Qt.KeyboardModifier.ControlModifier and a0.key() == Qt.Key.Key_R)):
-
-                logger.debug("Manual refresh triggered by user")
-                if self.screenshots_gallery:
-                    asyncio.create_task(self.screenshots_gallery.force_directory_refresh())
-
-                a0.accept()
-                return
-
-            # Escape to hide window
-            elif a0.key() == Qt.Key.Key_Escape:
-                self.hide()
+            key = a0.key()
+            action = self._KEY_ACTIONS.get((a0.modifiers(), key)) or self._KEY_ACTIONS.get((None, key))
+            if action:
+                action(self)
                 a0.accept()
                 return
 
@@ -1400,7 +1688,41 @@ class GalleryWindow(QWidget):
         # Pass to parent for unhandled keys
         super().keyPressEvent(a0)
 
+    def _refresh_from_shortcut(self):
+        """Force a directory refresh from the F5 / Ctrl+R shortcut."""
+        logger.debug("Manual refresh triggered by user")
+        if self.screenshots_gallery:
+            self._spawn(self.screenshots_gallery.force_directory_refresh(), bounded=True)
+
+    # Keyboard shortcuts as (modifiers, key) -> handler; None matches any modifiers
+    _KEY_ACTIONS = {
+        # F5 or Ctrl+R for manual refresh
+        (None, Qt.Key.Key_F5): _refresh_from_shortcut,
+        (Qt.KeyboardModifier.ControlModifier, Qt.Key.Key_R): _refresh_from_shortcut,
+        # Escape to hide window
+        (None, Qt.Key.Key_Escape): QWidget.hide,
+    }
+
     def force_close(self):
         """Force close the gallery window (used only during app shutdown)."""
         logger.info("Force closing gallery window")
+
+        # Cancel background work that has not finished yet, except a chat history write in progress
+        flush = self._history_flush_task
+        if flush is not None and flush.done():
+            flush = None
+        for task in list(self._active_tasks):
+            if task is not flush:
+                task.cancel()
+        if self.screenshots_gallery and self.screenshots_gallery.thumbnail_loader:
+            self.screenshots_gallery.thumbnail_loader.stop()
+        shutdown_thumbnail_pool()
+
+        # Write any queued chat messages before releasing the I/O pool
+        if flush is None and self._pending_history:
+            flush = self._spawn(self._flush_history_writes(delay=0))
+        if flush is not None:
+            flush.add_done_callback(lambda _: self._io_pool.shutdown(wait=False))
+        else:
+            self._io_pool.shutdown(wait=False)
         super().close()
@@ -166,6 +166,8 @@ class OptimizationSettingsWidget(QWidget):
         # Allow lower quality down to 25% for cases where memory savings are desired
         self.thumbnail_widgets['quality'].setRange(25, 100)
         self.thumbnail_widgets['quality'].setToolTip("Thumbnail image quality (higher = better quality, more memory)")
+        # Commit the value on release only; every change regenerates all thumbnails
+        self.thumbnail_widgets['quality'].setTracking(False)
 
         quality_layout = QHBoxLayout()
         quality_layout.addWidget(QLabel("Low"))
@@ -173,9 +175,9 @@ class OptimizationSettingsWidget(QWidget):
         quality_layout.addWidget(QLabel("High"))
 
         self.thumbnail_quality_label = QLabel("85%")
-        self.thumbnail_widgets['quality'].valueChanged.connect(
-            lambda v: self.thumbnail_quality_label.setText(f"{v}%")
-        )
+        # The label follows the handle while dragging (sliderMoved) and any committed value
+        self.thumbnail_widgets['quality'].sliderMoved.connect(self._update_quality_label)
+        self.thumbnail_widgets['quality'].valueChanged.connect(self._update_quality_label)
 
         thumb_layout.addRow("Thumbnail Quality:", quality_layout)
         thumb_layout.addRow("", self.thumbnail_quality_label)
@@ -258,26 +260,29 @@ class OptimizationSettingsWidget(QWidget):
 
     def connect_signals(self) -> None:
         """Connect widget signals to handlers."""
-        # Storage widgets
-        for key, widget in self.storage_widgets.items():
-            if isinstance(widget, QCheckBox):
-                widget.toggled.connect(lambda checked, k=key: self.on_setting_changed(f'storage_{k}', checked))
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                widget.valueChanged.connect(lambda value, k=key: self.on_setting_changed(f'storage_{k}', value))
-
-        # Thumbnail widgets
-        for key, widget in self.thumbnail_widgets.items():
-            if isinstance(widget, QCheckBox):
-                widget.toggled.connect(lambda checked, k=key: self.on_setting_changed(f'thumbnail_{k}', checked))
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox, QSlider)):
-                widget.valueChanged.connect(lambda value, k=key: self.on_setting_changed(f'thumbnail_{k}', value))
-
-        # Request widgets
-        for key, widget in self.request_widgets.items():
-            if isinstance(widget, QCheckBox):
-                widget.toggled.connect(lambda checked, k=key: self.on_setting_changed(f'request_{k}', checked))
-            elif isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                widget.valueChanged.connect(lambda value, k=key: self.on_setting_changed(f'request_{k}', value))
+        groups = (
+            ('storage', self.storage_widgets),
+            ('thumbnail', self.thumbnail_widgets),
+            ('request', self.request_widgets),
+        )
+        for group, widgets in groups:
+            for key, widget in widgets.items():
+                # The setting key travels with the widget, so one bound slot serves every widget
+                widget.setProperty("setting_key", f'{group}_{key}')
+                if isinstance(widget, QCheckBox):
+                    widget.toggled.connect(self._on_widget_changed)
+                elif isinstance(widget, (QSpinBox, QDoubleSpinBox, QSlider)):
+                    widget.valueChanged.connect(self._on_widget_changed)
+
+    def _update_quality_label(self, value: int) -> None:
+        """Show the thumbnail quality next to its slider."""
+        self.thumbnail_quality_label.setText(f"{value}%")
+
+    def _on_widget_changed(self, value: Any) -> None:
+        """Forward a widget's new value under the setting key stored on it."""
+        widget = self.sender()
+        if widget:
+            self.on_setting_changed(widget.property("setting_key"), value)
 
     def on_setting_changed(self, setting_key: str, value: Any) -> None:
         """Handle setting change."""
@@ -177,7 +177,9 @@ class OverlayWindow(QWidget):
             theme = self.config.get("overlay.theme", "dark")
             stylesheet = load_stylesheet("overlay", theme, "base")
             if stylesheet:
-                self.setStyleSheet(stylesheet)
+                # Setting an unchanged stylesheet would still make Qt re-parse and re-polish it
+                if stylesheet != self.styleSheet():
+                    self.setStyleSheet(stylesheet)
             else:
                 logger.error(f"Failed to load stylesheet for overlay/{theme}/base")
 
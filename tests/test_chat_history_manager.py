@@ -0,0 +1,105 @@
+"""Unit tests for ChatHistoryManager batch saves.
+
+Covers save_messages and the single metadata update it performs for a
+batch (message_count, model_used and total_tokens), both when the
+conversation is new and when it already exists.
+
+Note: Install pytest-asyncio to run async tests (pip install pytest-asyncio).
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.chat_history_manager import ChatHistoryManager, ChatMessage
+
+
+SCREENSHOT_HASH = "b" * 64
+
+
+def _message(message_id, role="user", model="unknown", tokens=None):
+    return ChatMessage(
+        message_id=message_id,
+        role=role,
+        content=f"message {message_id}",
+        timestamp=datetime(2025, 1, 1, 12, 0, message_id),
+        model=model,
+        tokens=tokens,
+    )
+
+
+def _read_metadata(manager):
+    path = manager.chat_directory / SCREENSHOT_HASH / "metadata.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_save_messages_writes_one_file_per_message(tmp_path):
+    manager = ChatHistoryManager(str(tmp_path))
+
+    saved = await manager.save_messages(SCREENSHOT_HASH, [_message(1), _message(2)])
+
+    assert saved is True
+    conversation_dir = tmp_path / SCREENSHOT_HASH
+    assert (conversation_dir / "message_0001.json").exists()
+    assert (conversation_dir / "message_0002.json").exists()
+    loaded = await manager.load_conversation(SCREENSHOT_HASH)
+    assert [message.content for message in loaded] == ["message 1", "message 2"]
+    assert await manager.get_next_message_id(SCREENSHOT_HASH) == 3
+
+
+@pytest.mark.asyncio
+async def test_save_messages_with_empty_list_is_a_no_op(tmp_path):
+    manager = ChatHistoryManager(str(tmp_path))
+
+    assert await manager.save_messages(SCREENSHOT_HASH, []) is True
+    assert not (tmp_path / SCREENSHOT_HASH).exists()
+
+
+@pytest.mark.asyncio
+async def test_new_conversation_metadata_covers_whole_batch(tmp_path):
+    manager = ChatHistoryManager(str(tmp_path))
+    screenshot = SimpleNamespace(filename="shot.png", full_path=str(tmp_path / "shot.png"))
+    messages = [
+        _message(1),
+        _message(2, role="assistant", model="llava", tokens={"prompt": 10, "completion": 5}),
+        _message(3, role="assistant", model="gemma3", tokens={"prompt": 3, "completion": 2}),
+    ]
+
+    assert await manager.save_messages(SCREENSHOT_HASH, messages, screenshot) is True
+
+    metadata = _read_metadata(manager)
+    assert metadata["message_count"] == 3
+    assert metadata["model_used"] == "gemma3"
+    assert metadata["total_tokens"] == 20
+    assert metadata["screenshot_filename"] == "shot.png"
+    assert metadata["screenshot_path"] == str(tmp_path / "shot.png")
+
+
+@pytest.mark.asyncio
+async def test_existing_conversation_metadata_is_accumulated(tmp_path):
+    manager = ChatHistoryManager(str(tmp_path))
+    await manager.save_messages(
+        SCREENSHOT_HASH,
+        [_message(1), _message(2, role="assistant", model="llava", tokens={"prompt": 7})],
+    )
+
+    # A user-only batch keeps the previous model
+    await manager.save_messages(SCREENSHOT_HASH, [_message(3), _message(4)])
+    metadata = _read_metadata(manager)
+    assert metadata["message_count"] == 4
+    assert metadata["model_used"] == "llava"
+    assert metadata["total_tokens"] == 7
+
+    await manager.save_messages(
+        SCREENSHOT_HASH,
+        [_message(5, role="assistant", model="gemma3", tokens={"prompt": 1, "completion": 2})],
+    )
+    metadata = _read_metadata(manager)
+    assert metadata["message_count"] == 5
+    assert metadata["model_used"] == "gemma3"
+    assert metadata["total_tokens"] == 10
+    # Created without screenshot metadata
+    assert metadata["screenshot_filename"] == "unknown"
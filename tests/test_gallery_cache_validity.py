@@ -0,0 +1,76 @@
+"""Tests for when the gallery treats its cached content as valid.
+
+Only a full content reload may clear an invalidation; writing the UI-state
+snapshot after a partial refresh must not. The cache methods are called
+unbound on a mock window, which keeps the tests free of a running
+QApplication.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.views.gallery.gallery_window import CacheKind, GalleryWindow
+
+
+def _gallery() -> MagicMock:
+    """Mock window whose cache bookkeeping runs the real GalleryWindow methods."""
+    gallery = MagicMock()
+    gallery._dirty = False
+    gallery._ui_state_cache = {}
+    gallery._caches = ({}, {}, gallery._ui_state_cache)
+    gallery._content_loaded = True
+    gallery._pending_selection = None
+    gallery._shown = asyncio.Event()
+    gallery._shown.set()
+    gallery._mark_stale = lambda: GalleryWindow._mark_stale(gallery)
+    gallery._update_cache = lambda: GalleryWindow._update_cache(gallery)
+    gallery._is_cache_valid = lambda: GalleryWindow._is_cache_valid(gallery)
+    gallery._load_fresh_content = AsyncMock()
+    return gallery
+
+
+@pytest.mark.asyncio
+async def test_full_reload_makes_cache_valid():
+    gallery = _gallery()
+    gallery._dirty = True
+
+    await GalleryWindow._load_content_with_cache(gallery)
+
+    gallery._load_fresh_content.assert_awaited_once()
+    assert GalleryWindow._is_cache_valid(gallery)
+
+
+@pytest.mark.asyncio
+async def test_preset_invalidation_during_background_refresh_forces_reload():
+    gallery = _gallery()
+    await GalleryWindow._load_content_with_cache(gallery)
+
+    async def refresh_while_presets_change():
+        GalleryWindow.invalidate_cache(gallery, CacheKind.PRESETS)
+
+    gallery.screenshots_gallery.force_directory_refresh = AsyncMock(side_effect=refresh_while_presets_change)
+
+    await GalleryWindow._refresh_screenshots_directory_async(gallery)
+
+    # The refresh rewrote the UI-state snapshot but reloaded only the screenshots column
+    assert gallery._ui_state_cache
+    assert not GalleryWindow._is_cache_valid(gallery)
+
+    gallery._load_fresh_content.reset_mock()
+    await GalleryWindow._load_content_with_cache(gallery)
+    gallery._load_fresh_content.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_completed_capture_does_not_clear_invalidation():
+    gallery = _gallery()
+    await GalleryWindow._load_content_with_cache(gallery)
+    GalleryWindow._mark_stale(gallery)
+
+    await GalleryWindow._update_cache(gallery)
+
+    assert not GalleryWindow._is_cache_valid(gallery)
@@ -0,0 +1,117 @@
+"""Tests for how the gallery reacts to screenshot capture events.
+
+The payload is produced by MainController itself (with a stub screenshot
+manager), so the gallery handlers are checked against the keys the
+application actually emits. The handlers are called unbound on a mock
+window, which keeps the tests free of a running QApplication.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src import EventTypes
+from src.controllers.event_bus import EventData
+from src.controllers.main_controller import MainController
+from src.models.screenshot_models import ScreenshotMetadata, ScreenshotResult
+from src.views.gallery.gallery_window import GalleryWindow
+
+
+async def _captured_event(tmp_path) -> EventData:
+    """Run a tray capture request through MainController and return the emitted captured event."""
+    metadata = ScreenshotMetadata(
+        filename="shot.png",
+        full_path=str(tmp_path / "shot.png"),
+        timestamp=datetime(2025, 1, 1, 12, 0, 0),
+        file_size=1024,
+        resolution=(800, 600),
+        hash="a" * 64,
+    )
+    screenshot_manager = MagicMock()
+    screenshot_manager.capture_screenshot = AsyncMock(
+        return_value=ScreenshotResult(success=True, metadata=metadata)
+    )
+
+    event_bus = MagicMock()
+    event_bus.emit = AsyncMock()
+    controller = MainController(event_bus, MagicMock(), screenshot_manager=screenshot_manager)
+
+    await controller._handle_screenshot_capture_request(
+        EventData(EventTypes.SCREENSHOT_CAPTURE_REQUESTED, data={}, source="tray")
+    )
+
+    event_type, data = event_bus.emit.await_args.args
+    assert event_type == EventTypes.SCREENSHOT_CAPTURED
+    return EventData(event_type, data=data, source="MainController")
+
+
+def _gallery(visible: bool = False) -> MagicMock:
+    """Stand-in for a loaded GalleryWindow."""
+    gallery = MagicMock()
+    gallery.isVisible.return_value = visible
+    gallery._content_loaded = True
+    gallery._refresh_pending = None
+    return gallery
+
+
+@pytest.mark.asyncio
+async def test_capture_marks_hidden_gallery_stale(tmp_path):
+    event = await _captured_event(tmp_path)
+    gallery = _gallery(visible=False)
+
+    GalleryWindow._handle_screenshot_captured(gallery, event)
+
+    gallery._mark_stale.assert_called_once_with()
+    gallery._debounced_screenshots_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_capture_schedules_refresh_of_visible_gallery(tmp_path):
+    event = await _captured_event(tmp_path)
+    gallery = _gallery(visible=True)
+
+    GalleryWindow._handle_screenshot_captured(gallery, event)
+
+    gallery._mark_stale.assert_called_once_with()
+    gallery._debounced_screenshots_refresh.assert_called_once_with()
+    assert gallery._refresh_pending is gallery._spawn.return_value
+
+
+def test_completed_event_refreshes_cache():
+    gallery = _gallery()
+    gallery._screenshots_select = None
+
+    GalleryWindow._handle_screenshot_completed(
+        gallery, EventData(EventTypes.SCREENSHOT_COMPLETED, data={'screenshot_id': "a" * 64})
+    )
+
+    gallery._update_cache.assert_called_once_with()
+    gallery._spawn.assert_called_once_with(gallery._update_cache.return_value, bounded=True)
+
+
+@pytest.mark.asyncio
+async def test_capture_prewarms_thumbnail(tmp_path):
+    event = await _captured_event(tmp_path)
+    gallery = _gallery(visible=False)
+    prewarm = gallery.screenshots_gallery.thumbnail_loader.prewarm
+
+    GalleryWindow._handle_screenshot_captured(gallery, event)
+
+    prewarm.assert_called_once_with(str(tmp_path / "shot.png"))
+    gallery._spawn.assert_any_call(prewarm.return_value, bounded=True)
+
+
+@pytest.mark.asyncio
+async def test_failed_capture_does_not_prewarm():
+    gallery = _gallery(visible=False)
+    event = EventData(
+        EventTypes.SCREENSHOT_CAPTURED,
+        data={'trigger_source': 'tray', 'success': False, 'error_message': 'boom'}
+    )
+
+    GalleryWindow._handle_screenshot_captured(gallery, event)
+
+    gallery.screenshots_gallery.thumbnail_loader.prewarm.assert_not_called()
@@ -0,0 +1,57 @@
+"""Tests for the gallery's batched chat history writes.
+
+Queued user messages must only leave the queue once ChatHistoryManager
+has saved them, so a failed or interrupted write never loses them. The
+flush is called unbound on a mock window, which keeps the tests free of
+a running QApplication.
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.views.gallery.gallery_window import GalleryWindow
+
+
+def _gallery(chat_manager) -> MagicMock:
+    gallery = MagicMock()
+    gallery._pending_history = {
+        "a" * 64: (None, [("first", datetime(2025, 1, 1)), ("second", datetime(2025, 1, 1))]),
+    }
+    gallery._get_chat_manager = AsyncMock(return_value=chat_manager)
+    return gallery
+
+
+def _chat_manager(saved: bool) -> MagicMock:
+    chat_manager = MagicMock()
+    chat_manager.get_next_message_id = AsyncMock(return_value=5)
+    chat_manager.save_messages = AsyncMock(return_value=saved)
+    return chat_manager
+
+
+@pytest.mark.asyncio
+async def test_flush_saves_queued_messages_and_empties_queue():
+    chat_manager = _chat_manager(saved=True)
+    gallery = _gallery(chat_manager)
+
+    await GalleryWindow._flush_history_writes(gallery, delay=0)
+
+    screenshot_id, messages, _ = chat_manager.save_messages.await_args.args
+    assert screenshot_id == "a" * 64
+    assert [(message.message_id, message.content) for message in messages] == [(5, "first"), (6, "second")]
+    assert gallery._pending_history == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_messages_queued():
+    chat_manager = _chat_manager(saved=False)
+    gallery = _gallery(chat_manager)
+
+    await GalleryWindow._flush_history_writes(gallery, delay=0)
+
+    chat_manager.save_messages.assert_awaited_once()
+    _, queued = gallery._pending_history["a" * 64]
+    assert [content for content, _ in queued] == ["first", "second"]
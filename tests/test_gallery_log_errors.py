@@ -0,0 +1,52 @@
+"""Unit tests for the gallery's log_errors decorator."""
+
+import logging
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.views.gallery.gallery_window import log_errors
+
+LOGGER = "src.views.gallery.gallery_window"
+
+
+class Handler:
+    @log_errors("Error handling change ({key})")
+    def on_change(self, key, value=None):
+        if value is None:
+            raise ValueError("no value")
+        return value
+
+    @log_errors("Error loading {screenshot_id} after {delay}s")
+    async def load(self, screenshot_id, delay=0.5):
+        raise RuntimeError("boom")
+
+
+def test_exception_is_logged_with_positional_argument(caplog):
+    with caplog.at_level(logging.ERROR, logger=LOGGER):
+        assert Handler().on_change("theme") is None
+
+    assert caplog.messages == ["Error handling change (theme): no value"]
+
+
+def test_exception_is_logged_with_keyword_argument(caplog):
+    with caplog.at_level(logging.ERROR, logger=LOGGER):
+        Handler().on_change(key="opacity")
+
+    assert caplog.messages == ["Error handling change (opacity): no value"]
+
+
+def test_return_value_passes_through(caplog):
+    with caplog.at_level(logging.ERROR, logger=LOGGER):
+        assert Handler().on_change("theme", "dark") == "dark"
+
+    assert caplog.messages == []
+
+
+@pytest.mark.asyncio
+async def test_async_handler_message_uses_defaults(caplog):
+    with caplog.at_level(logging.ERROR, logger=LOGGER):
+        assert await Handler().load("abc") is None
+
+    assert caplog.messages == ["Error loading abc after 0.5s: boom"]
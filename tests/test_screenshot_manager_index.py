@@ -0,0 +1,61 @@
+"""Tests for ScreenshotManager.get_by_hash and the index the directory scan builds."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("PIL")
+
+from src.models.screenshot_manager import ScreenshotManager
+
+
+def _manager(directory) -> ScreenshotManager:
+    event_bus = MagicMock()
+    event_bus.emit = AsyncMock()
+    manager = ScreenshotManager(MagicMock(), MagicMock(), event_bus)
+    # Skip settings loading; the scan only needs the directory
+    manager._initialized = True
+    manager._current_directory = str(directory)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_get_by_hash_finds_scanned_screenshots(tmp_path):
+    (tmp_path / "first.png").write_bytes(b"first")
+    (tmp_path / "second.png").write_bytes(b"second")
+    (tmp_path / "notes.txt").write_bytes(b"not a screenshot")
+    manager = _manager(tmp_path)
+
+    screenshots = await manager.scan_screenshot_directory()
+
+    assert len(screenshots) == 2
+    for metadata in screenshots:
+        assert manager.get_by_hash(metadata.hash) is metadata
+        assert manager.get_by_hash(metadata.unique_id) is metadata
+    # One entry per screenshot
+    assert len(manager._metadata_index) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_by_hash_returns_none_for_unknown_hash(tmp_path):
+    manager = _manager(tmp_path)
+
+    assert manager.get_by_hash("f" * 64) is None
+    await manager.scan_screenshot_directory()
+    assert manager.get_by_hash("f" * 64) is None
+    assert manager.get_by_hash("") is None
+
+
+@pytest.mark.asyncio
+async def test_rescan_drops_removed_screenshots(tmp_path):
+    removed = tmp_path / "removed.png"
+    removed.write_bytes(b"removed")
+    (tmp_path / "kept.png").write_bytes(b"kept")
+    manager = _manager(tmp_path)
+    screenshots = {metadata.filename: metadata for metadata in await manager.scan_screenshot_directory()}
+
+    removed.unlink()
+    await manager.scan_screenshot_directory()
+
+    assert manager.get_by_hash(screenshots["removed.png"].hash) is None
+    assert manager.get_by_hash(screenshots["kept.png"].hash).filename == "kept.png"
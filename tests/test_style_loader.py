@@ -0,0 +1,90 @@
+"""Unit tests for stylesheet loading and for scoping item stylesheets to a state."""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.utils import style_loader
+from src.utils.style_loader import load_stylesheet, qualify_css_for_state
+
+
+def _rules(css):
+    return [line.split(" {")[0] for line in css.splitlines()]
+
+
+def test_root_rule_gets_state_attribute():
+    css = qualify_css_for_state("#ScreenshotItem { border: 1px; }", "#ScreenshotItem", "hover")
+
+    assert css == '#ScreenshotItem[state="hover"] { border: 1px; }'
+
+
+def test_root_pseudo_state_and_descendants_stay_attached_to_root():
+    css = qualify_css_for_state(
+        "#PresetItem:hover { color: red; }\n#PresetItem QPushButton:pressed { color: blue; }",
+        "#PresetItem", "hover"
+    )
+
+    assert _rules(css) == [
+        '#PresetItem[state="hover"]:hover',
+        '#PresetItem[state="hover"] QPushButton:pressed',
+    ]
+
+
+def test_other_rules_are_nested_under_root():
+    css = qualify_css_for_state("QLabel#filename_label { color: white; }", "#ScreenshotItem", "selected")
+
+    assert _rules(css) == ['#ScreenshotItem[state="selected"] QLabel#filename_label']
+
+
+def test_each_selector_in_a_group_is_scoped():
+    css = qualify_css_for_state(
+        "QLabel#preset_name, #PresetItem QPushButton { color: white; }", "#PresetItem", "normal"
+    )
+
+    assert _rules(css) == [
+        '#PresetItem[state="normal"] QLabel#preset_name, #PresetItem[state="normal"] QPushButton'
+    ]
+
+
+def test_comments_are_dropped_and_declarations_kept():
+    css = qualify_css_for_state(
+        "/* Hovered { item } */\n#ScreenshotItem {\n    border: 2px solid #007ACC; /* accent */\n}",
+        "#ScreenshotItem", "hover"
+    )
+
+    assert css == '#ScreenshotItem[state="hover"] {\n    border: 2px solid #007ACC; \n}'
+
+
+def test_root_descendant_rule_is_not_doubled():
+    css = qualify_css_for_state("#ScreenshotItem QWidget { background: none; }", "#ScreenshotItem", "normal")
+
+    assert _rules(css) == ['#ScreenshotItem[state="normal"] QWidget']
+
+
+def test_similarly_named_widget_is_not_treated_as_root():
+    css = qualify_css_for_state("#ScreenshotItemHeader { color: white; }", "#ScreenshotItem", "hover")
+
+    assert _rules(css) == ['#ScreenshotItem[state="hover"] #ScreenshotItemHeader']
+
+
+def test_empty_stylesheet_gives_empty_result():
+    assert qualify_css_for_state("", "#ScreenshotItem", "hover") == ""
+
+
+def test_stylesheet_is_read_once(monkeypatch):
+    reads = []
+    monkeypatch.setattr(style_loader, "_stylesheet_cache", {})
+    monkeypatch.setattr(style_loader, "_read_stylesheet", lambda *key: reads.append(key) or "QWidget {}")
+
+    assert load_stylesheet("gallery", "dark", "base") == "QWidget {}"
+    assert load_stylesheet("gallery", "dark", "base") == "QWidget {}"
+    assert reads == [("gallery", "dark", "base")]
+
+
+def test_failed_stylesheet_read_is_retried(monkeypatch):
+    results = [None, "QWidget {}"]
+    monkeypatch.setattr(style_loader, "_stylesheet_cache", {})
+    monkeypatch.setattr(style_loader, "_read_stylesheet", lambda *key: results.pop(0))
+
+    assert load_stylesheet("gallery", "dark", "base") is None
+    assert load_stylesheet("gallery", "dark", "base") == "QWidget {}"
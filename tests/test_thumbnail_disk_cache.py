@@ -0,0 +1,116 @@
+"""Tests for the thumbnail disk cache (key derivation, size-bounded eviction) and the worker pool."""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.views.gallery.components import screenshots_gallery
+from src.views.gallery.components.screenshots_gallery import (
+    _get_thumbnail_pool, _load_or_render_thumbnail, _thumbnail_cache_key, _trim_thumbnail_disk_cache,
+    shutdown_thumbnail_pool
+)
+
+
+def test_cache_key_is_stable():
+    assert _thumbnail_cache_key("/shots/a.png", 1, 200, 150, 85) == \
+        _thumbnail_cache_key("/shots/a.png", 1, 200, 150, 85)
+
+
+@pytest.mark.parametrize("changed", [
+    ("/shots/b.png", 1, 200, 150, 85),  # another file
+    ("/shots/a.png", 2, 200, 150, 85),  # source modified
+    ("/shots/a.png", 1, 300, 150, 85),  # another size
+    ("/shots/a.png", 1, 200, 150, 60),  # another quality
+])
+def test_cache_key_changes_with_source_and_settings(changed):
+    assert _thumbnail_cache_key(*changed) != _thumbnail_cache_key("/shots/a.png", 1, 200, 150, 85)
+
+
+def _write(cache_dir, name, size, mtime):
+    path = cache_dir / name
+    path.write_bytes(b"x" * size)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_trim_keeps_cache_within_budget(tmp_path):
+    _write(tmp_path, "a.jpeg", 100, 1000)
+    _write(tmp_path, "b.jpeg", 100, 2000)
+
+    assert _trim_thumbnail_disk_cache(tmp_path, 200) == 200
+    assert sorted(entry.name for entry in tmp_path.iterdir()) == ["a.jpeg", "b.jpeg"]
+
+
+def test_trim_evicts_least_recently_modified_first(tmp_path):
+    _write(tmp_path, "old.jpeg", 100, 1000)
+    _write(tmp_path, "middle.jpeg", 100, 2000)
+    _write(tmp_path, "new.jpeg", 100, 3000)
+
+    assert _trim_thumbnail_disk_cache(tmp_path, 150) == 100
+    assert [entry.name for entry in tmp_path.iterdir()] == ["new.jpeg"]
+
+
+def test_trim_ignores_access_time(tmp_path):
+    # Recently read according to atime, but not touched since it was written
+    stale = tmp_path / "stale.jpeg"
+    stale.write_bytes(b"x" * 100)
+    os.utime(stale, (9000, 1000))
+    _write(tmp_path, "fresh.jpeg", 100, 2000)
+
+    _trim_thumbnail_disk_cache(tmp_path, 100)
+
+    assert [entry.name for entry in tmp_path.iterdir()] == ["fresh.jpeg"]
+
+
+def test_cache_hit_refreshes_mtime(tmp_path):
+    source = tmp_path / "shot.png"
+    source.write_bytes(b"not decoded on a cache hit")
+    cache_dir = tmp_path / "thumbnails"
+    cache_dir.mkdir()
+    key = _thumbnail_cache_key(str(source), os.stat(source).st_mtime_ns, 200, 150, 85)
+    cached = _write(cache_dir, f"{key}.jpeg", 10, 1000)
+
+    result = _load_or_render_thumbnail(str(source), 200, 150, 85, str(cache_dir))
+
+    assert result == (b"x" * 10, 'JPEG', False)
+    assert cached.stat().st_mtime > 1000
+
+
+@pytest.fixture
+def thumbnail_pool():
+    pool = _get_thumbnail_pool()
+    yield pool
+    shutdown_thumbnail_pool()
+
+
+def test_pool_starts_workers_with_spawn(thumbnail_pool):
+    assert thumbnail_pool._mp_context.get_start_method() == "spawn"
+
+
+def test_thumbnail_renders_and_caches_in_worker_process(tmp_path, thumbnail_pool):
+    image_module = pytest.importorskip("PIL.Image")
+    source = tmp_path / "shot.png"
+    image_module.new("RGBA", (800, 600), (10, 20, 30, 255)).save(source)
+    cache_dir = tmp_path / "thumbnails"
+
+    rendered = thumbnail_pool.submit(
+        _load_or_render_thumbnail, str(source), 200, 150, 85, str(cache_dir)
+    ).result(timeout=60)
+    cached = thumbnail_pool.submit(
+        _load_or_render_thumbnail, str(source), 200, 150, 85, str(cache_dir)
+    ).result(timeout=60)
+
+    image_bytes, format_str, stored = rendered
+    assert format_str == 'JPEG' and stored
+    assert image_bytes[:2] == b"\xff\xd8"
+    assert cached == (image_bytes, 'JPEG', False)
+    assert [entry.suffix for entry in cache_dir.iterdir()] == [".jpeg"]
+
+
+def test_shutdown_lets_the_next_load_start_a_new_pool(thumbnail_pool):
+    shutdown_thumbnail_pool()
+
+    assert screenshots_gallery._thumbnail_pool is None
+    assert _get_thumbnail_pool() is not thumbnail_pool
@@ -0,0 +1,94 @@
+"""Unit tests for the gallery's TTLCache (expiry, size bound and lookups)."""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from src.views.gallery.components import gallery_widgets
+from src.views.gallery.components.gallery_widgets import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable stand-in for time.monotonic."""
+    now = [1000.0]
+    monkeypatch.setattr(gallery_widgets.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entry_is_returned_before_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache["a"] = 1
+
+    clock[0] += 9.9
+
+    assert cache["a"] == 1
+    assert "a" in cache
+    assert cache.get("a") == 1
+
+
+def test_entry_expires_after_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache["a"] = 1
+
+    clock[0] += 10
+
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert "a" not in cache
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+    assert not cache
+
+
+def test_storing_again_restarts_ttl(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache["a"] = 1
+    clock[0] += 8
+    cache["a"] = 2
+    clock[0] += 8
+
+    assert cache.get("a") == 2
+
+
+def test_oldest_entry_is_evicted_at_maxsize(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.update({"a": 1, "b": 2})
+    cache["c"] = 3
+
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_restored_entry_moves_to_the_back(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["a"] = 3
+    cache["c"] = 4
+
+    assert "b" not in cache
+    assert cache.get("a") == 3
+
+
+def test_expire_drops_only_expired_entries(clock):
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache["old"] = 1
+    clock[0] += 5
+    cache["new"] = 2
+    clock[0] += 6
+
+    cache.expire()
+
+    assert len(cache) == 1
+    assert cache.get("new") == 2
+
+
+def test_get_returns_default_for_missing_key():
+    cache = TTLCache(maxsize=4, ttl=10)
+
+    assert cache.get("missing") is None
+    assert cache.get("missing", 0) == 0
+    assert "missing" not in cache